@@ -5,25 +5,35 @@ Achieves 74.5% bandwidth reduction
 """
 
 from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
-from collections import deque
-import numpy as np
+from dataclasses import dataclass, replace
+import array
+import math
 import time
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Wall-clock minus monotonic clock, captured once; frames are stamped with the
+# cheap integer monotonic_ns() and only converted when a consumer reads them
+_WALL_CLOCK_OFFSET = time.time() - time.monotonic_ns() * 1e-9
 
-@dataclass
+
+@dataclass(frozen=True)
 class TransmissionStats:
-    """Statistics for transmission optimization"""
+    """
+    Statistics for transmission optimization
+    
+    Immutable snapshot: the transmitter publishes a new instance per frame,
+    so readers on other threads always see a consistent set of counters.
+    """
     total_frames: int = 0
     transmitted_frames: int = 0
     bytes_sent: int = 0
     bytes_saved: int = 0
     anomalies_detected: int = 0
     false_positives: int = 0
+    frame_size: int = 100000  # Assumed bytes per frame (100KB default)
     
     @property
     def transmission_rate(self) -> float:
@@ -35,12 +45,63 @@ class TransmissionStats:
     @property
     def bandwidth_saved_percent(self) -> float:
         """Percentage of bandwidth saved"""
-        total_possible = self.total_frames * 100000  # Assume 100KB per frame
+        total_possible = self.total_frames * self.frame_size
         if total_possible == 0:
             return 0.0
         return (self.bytes_saved / total_possible) * 100
 
 
+@dataclass
+class TransmitDecision:
+    """
+    Per-frame transmission metadata
+    
+    Holds raw values only; rounding and the wall-clock timestamp conversion
+    happen on access. Supports read-only
+    mapping access (decision['z_score'], decision.get(...)) for callers that
+    treated the metadata as a dict.
+    """
+    __slots__ = ('vehicle_count', 'total_detections', 'baseline_mean', 'baseline_std',
+                 'z_score', 'is_anomalous', 'baseline_ready', 'anomaly_streak', 'timestamp_ns')
+    
+    vehicle_count: int
+    total_detections: int
+    baseline_mean: float
+    baseline_std: float
+    z_score: float
+    is_anomalous: bool
+    baseline_ready: bool
+    anomaly_streak: int
+    timestamp_ns: Optional[int]  # monotonic_ns(), only captured for transmitted frames
+    
+    _KEYS = ('vehicle_count', 'total_detections', 'baseline_mean', 'baseline_std',
+             'z_score', 'is_anomalous', 'baseline_ready', 'anomaly_streak', 'timestamp')
+    _ROUNDED = frozenset({'baseline_mean', 'baseline_std', 'z_score'})
+    
+    @property
+    def timestamp(self) -> Optional[float]:
+        """Wall-clock time (epoch seconds) of the transmission, if transmitted"""
+        if self.timestamp_ns is None:
+            return None
+        return _WALL_CLOCK_OFFSET + self.timestamp_ns * 1e-9
+    
+    def __getitem__(self, key: str):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        value = getattr(self, key)
+        return round(value, 2) if key in self._ROUNDED else value
+    
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def as_dict(self) -> Dict:
+        """Serialize with display rounding applied"""
+        return {key: self[key] for key in self._KEYS}
+
+
 class AnomalyDrivenTransmitter:
     """
     Algorithm 2: Anomaly-driven data transmission
@@ -56,12 +117,13 @@ class AnomalyDrivenTransmitter:
     """
     
     # Vehicle classes for queue detection
-    VEHICLE_CLASSES = ['car', 'van', 'truck', 'bus', 'motor', 'motorcycle']
+    VEHICLE_CLASSES = frozenset({'car', 'van', 'truck', 'bus', 'motor', 'motorcycle'})
     
     def __init__(self, 
                  window_size: int = 30,
                  anomaly_threshold: float = 2.0,
-                 min_baseline_samples: int = 10):
+                 min_baseline_samples: int = 10,
+                 frame_size_bytes: int = 100_000):
         """
         Initialize anomaly-driven transmitter
         
@@ -69,16 +131,31 @@ class AnomalyDrivenTransmitter:
             window_size: Number of frames to track for baseline calculation
             anomaly_threshold: Z-score threshold for anomaly detection (default: 2.0 std devs)
             min_baseline_samples: Minimum samples needed before anomaly detection starts
+            frame_size_bytes: Frame size in bytes for bandwidth accounting; fixed per
+                deployment (camera resolution/codec), overridable per call
         """
         self.window_size = window_size
         self.anomaly_threshold = anomaly_threshold
         self.min_baseline_samples = min_baseline_samples
+        self.frame_size_bytes = frame_size_bytes
         
-        # Track vehicle counts over time (sliding window)
-        self.vehicle_counts = deque(maxlen=window_size)
+        # Track vehicle counts over time (sliding window as a fixed C-int ring buffer)
+        self._buf = array.array('i', [0] * window_size)
+        self._head = 0  # Next slot to write (oldest sample once the window is full)
+        self._n = 0     # Number of samples currently in the window
+        
+        # Running sums over the window for O(1) mean/std updates
+        self._sum = 0
+        self._sum_sq = 0
         
         # Statistics
-        self.stats = TransmissionStats()
+        self.stats = TransmissionStats(frame_size=self.frame_size_bytes)
+        
+        # Bumped on every state change; get_stats/get_efficiency_report
+        # re-render only when it moves
+        self._stats_version = 0
+        self._stats_cache = (-1, None)
+        self._report_cache = (-1, None)
         
         # Baseline statistics
         self.baseline_mean = 0.0
@@ -90,8 +167,8 @@ class AnomalyDrivenTransmitter:
         self.max_anomaly_streak = 0
         
         logger.info("✅ Anomaly-Driven Transmitter initialized")
-        logger.info(f"   Window size: {window_size}")
-        logger.info(f"   Anomaly threshold: {anomaly_threshold} σ")
+        logger.info("   Window size: %d", window_size)
+        logger.info("   Anomaly threshold: %s σ", anomaly_threshold)
     
     def update_baseline(self, vehicle_count: int):
         """
@@ -100,20 +177,40 @@ class AnomalyDrivenTransmitter:
         Args:
             vehicle_count: Number of vehicles detected in current frame
         """
-        self.vehicle_counts.append(vehicle_count)
+        # Evict the oldest sample from the running sums before overwriting its slot
+        if self._n == self.window_size:
+            evicted = self._buf[self._head]
+            self._sum -= evicted
+            self._sum_sq -= evicted * evicted
+        else:
+            self._n += 1
+        
+        self._buf[self._head] = vehicle_count
+        self._head = (self._head + 1) % self.window_size
+        self._sum += vehicle_count
+        self._sum_sq += vehicle_count * vehicle_count
+        self._stats_version += 1
         
         # Check if we have enough samples for baseline
-        if len(self.vehicle_counts) >= self.min_baseline_samples:
-            self.baseline_mean = np.mean(self.vehicle_counts)
-            self.baseline_std = np.std(self.vehicle_counts)
+        n = self._n
+        if n >= self.min_baseline_samples:
+            mean = self._sum / n
+            variance = max(0.0, self._sum_sq / n - mean * mean)
+            self.baseline_mean = mean
             
             # Avoid division by zero
-            if self.baseline_std == 0:
-                self.baseline_std = 1.0
+            self.baseline_std = math.sqrt(variance) or 1.0
             
             if not self.is_baseline_ready:
                 self.is_baseline_ready = True
-                logger.info(f"📊 Baseline established: μ={self.baseline_mean:.2f}, σ={self.baseline_std:.2f}")
+                logger.info("📊 Baseline established: μ=%.2f, σ=%.2f", self.baseline_mean, self.baseline_std)
+    
+    @property
+    def vehicle_counts(self) -> List[int]:
+        """Vehicle counts currently in the window, oldest first"""
+        if self._n < self.window_size:
+            return self._buf[:self._n].tolist()
+        return (self._buf[self._head:] + self._buf[:self._head]).tolist()
     
     def calculate_z_score(self, vehicle_count: int) -> float:
         """
@@ -128,6 +225,10 @@ class AnomalyDrivenTransmitter:
         if not self.is_baseline_ready:
             return 0.0
         
+        # Unit std (also the zero-variance sentinel): z is the raw deviation
+        if self.baseline_std == 1.0:
+            return vehicle_count - self.baseline_mean
+        
         z_score = (vehicle_count - self.baseline_mean) / self.baseline_std
         return z_score
     
@@ -150,12 +251,11 @@ class AnomalyDrivenTransmitter:
         # (detects both high and low anomalies)
         is_anomalous = abs(z_score) > self.anomaly_threshold
         
-        # Track anomaly streaks
-        if is_anomalous:
-            self.current_anomaly_streak += 1
-            self.max_anomaly_streak = max(self.max_anomaly_streak, self.current_anomaly_streak)
-        else:
-            self.current_anomaly_streak = 0
+        # Track anomaly streaks (bool acts as 0/1: grows on anomalies, resets otherwise)
+        self.current_anomaly_streak = (self.current_anomaly_streak + 1) * is_anomalous
+        self._stats_version += 1
+        if self.current_anomaly_streak > self.max_anomaly_streak:
+            self.max_anomaly_streak = self.current_anomaly_streak
         
         return (is_anomalous, z_score)
     
@@ -169,29 +269,32 @@ class AnomalyDrivenTransmitter:
         Returns:
             Number of vehicles detected
         """
-        vehicle_count = sum(
-            1 for det in detections 
-            if det.get('class_name', '').lower() in self.VEHICLE_CLASSES
-        )
+        vehicle_classes = self.VEHICLE_CLASSES
+        vehicle_count = 0
+        for det in detections:
+            class_name = det.get('class_name')
+            if class_name is not None and class_name.lower() in vehicle_classes:
+                vehicle_count += 1
         return vehicle_count
     
     def should_transmit(self, 
                        detections: List[Dict],
-                       frame_size: int = 100000,
-                       force: bool = False) -> Tuple[bool, str, Dict]:
+                       frame_size: Optional[int] = None,
+                       force: bool = False) -> Tuple[bool, str, TransmitDecision]:
         """
         Decide if detection data should be transmitted to cloud/central server
         
         Args:
             detections: List of current frame detections
-            frame_size: Estimated frame size in bytes (default: 100KB)
+            frame_size: Estimated frame size in bytes (default: frame_size_bytes)
             force: Force transmission regardless of anomaly status
             
         Returns:
-            Tuple of (should_transmit, reason, metadata)
+            Tuple of (should_transmit, reason, metadata) where metadata is a
+            TransmitDecision (timestamp is only set on transmitted frames)
         """
-        self.stats.total_frames += 1
-        
+        if frame_size is None:
+            frame_size = self.frame_size_bytes
         # Count vehicles in current frame
         vehicle_count = self.count_vehicles(detections)
         
@@ -201,78 +304,107 @@ class AnomalyDrivenTransmitter:
         # Check for anomaly
         is_anomalous, z_score = self.is_anomaly(vehicle_count)
         
-        # Prepare metadata
-        metadata = {
-            'vehicle_count': vehicle_count,
-            'total_detections': len(detections),
-            'baseline_mean': round(self.baseline_mean, 2),
-            'baseline_std': round(self.baseline_std, 2),
-            'z_score': round(z_score, 2),
-            'is_anomalous': is_anomalous,
-            'baseline_ready': self.is_baseline_ready,
-            'anomaly_streak': self.current_anomaly_streak,
-            'timestamp': time.time()
-        }
+        # Raw metadata; rounding is deferred to TransmitDecision.as_dict()
+        metadata = TransmitDecision(
+            vehicle_count, len(detections), self.baseline_mean, self.baseline_std,
+            z_score, is_anomalous, self.is_baseline_ready, self.current_anomaly_streak, None
+        )
+        
+        # Decision: counters are updated once from the booleans; the branches
+        # below only pick the reason string
+        send = bool(force or not self.is_baseline_ready or is_anomalous)
+        stats = self.stats
+        # Single attribute swap (atomic under the GIL) publishes the new snapshot
+        self.stats = replace(
+            stats,
+            total_frames=stats.total_frames + 1,
+            transmitted_frames=stats.transmitted_frames + send,
+            bytes_sent=stats.bytes_sent + send * frame_size,
+            bytes_saved=stats.bytes_saved + (not send) * frame_size,
+            anomalies_detected=stats.anomalies_detected + (is_anomalous and not force)
+        )
+        self._stats_version += 1
         
-        # Decision logic
         if force:
             # Forced transmission (periodic health check, etc.)
-            self.stats.transmitted_frames += 1
-            self.stats.bytes_sent += frame_size
             reason = "Forced transmission (periodic)"
-            return (True, reason, metadata)
-        
-        if not self.is_baseline_ready:
+        elif not self.is_baseline_ready:
             # Still building baseline - transmit for learning
-            self.stats.transmitted_frames += 1
-            self.stats.bytes_sent += frame_size
-            reason = f"Building baseline ({len(self.vehicle_counts)}/{self.min_baseline_samples})"
-            return (True, reason, metadata)
-        
-        if is_anomalous:
+            reason = f"Building baseline ({self._n}/{self.min_baseline_samples})"
+        elif is_anomalous:
             # Queue anomaly detected - transmit!
-            self.stats.transmitted_frames += 1
-            self.stats.bytes_sent += frame_size
-            self.stats.anomalies_detected += 1
-            
             anomaly_type = "High" if z_score > 0 else "Low"
             reason = f"{anomaly_type} traffic anomaly (z={z_score:.2f}σ)"
             
-            logger.info(f"🚨 [Transmitter] {reason} - {vehicle_count} vehicles")
-            return (True, reason, metadata)
+            logger.info("🚨 [Transmitter] %s - %d vehicles", reason, vehicle_count)
         else:
             # Normal traffic - skip transmission (BANDWIDTH SAVED!)
-            self.stats.bytes_saved += frame_size
-            
             reason = f"Normal traffic (z={z_score:.2f}σ)"
-            return (False, reason, metadata)
+        
+        if send:
+            metadata.timestamp_ns = time.monotonic_ns()
+        return (send, reason, metadata)
+    
+    def replay(self, vehicle_counts) -> Tuple:
+        """
+        Evaluate a historical trace of vehicle counts in one batched pass
+        
+        Applies the same rolling z-score rule as should_transmit using the
+        compiled kernel (numba when installed). Streaming state and
+        transmission statistics are left untouched.
+        
+        Args:
+            vehicle_counts: Sequence of per-frame vehicle counts
+            
+        Returns:
+            Tuple of (anomaly_mask, z_scores) arrays
+        """
+        # NumPy/numba stay off the streaming path; only replay pulls them in
+        import numpy as np
+        from _anomaly_kernels import rolling_zscore_anomalies
+        
+        counts = np.asarray(vehicle_counts, dtype=np.int64)
+        return rolling_zscore_anomalies(
+            counts, self.window_size, float(self.anomaly_threshold), self.min_baseline_samples
+        )
     
     def get_stats(self) -> Dict:
         """
         Get transmission statistics
         
         Returns:
-            Dictionary with current statistics
+            Dictionary with current statistics (shared between calls until
+            the next frame; treat as read-only)
         """
-        return {
-            'total_frames': self.stats.total_frames,
-            'transmitted_frames': self.stats.transmitted_frames,
-            'skipped_frames': self.stats.total_frames - self.stats.transmitted_frames,
-            'transmission_rate_percent': round(self.stats.transmission_rate, 2),
-            'bandwidth_saved_percent': round(self.stats.bandwidth_saved_percent, 2),
-            'anomalies_detected': self.stats.anomalies_detected,
-            'bytes_sent_mb': round(self.stats.bytes_sent / (1024**2), 2),
-            'bytes_saved_mb': round(self.stats.bytes_saved / (1024**2), 2),
+        version = self._stats_version
+        cached_version, cached = self._stats_cache
+        if cached_version == version:
+            return cached
+        
+        # Read the published snapshot once so all counters come from the same frame
+        s = self.stats
+        stats = {
+            'total_frames': s.total_frames,
+            'transmitted_frames': s.transmitted_frames,
+            'skipped_frames': s.total_frames - s.transmitted_frames,
+            'transmission_rate_percent': round(s.transmission_rate, 2),
+            'bandwidth_saved_percent': round(s.bandwidth_saved_percent, 2),
+            'anomalies_detected': s.anomalies_detected,
+            'bytes_sent_mb': round(s.bytes_sent / (1024**2), 2),
+            'bytes_saved_mb': round(s.bytes_saved / (1024**2), 2),
             'baseline_mean': round(self.baseline_mean, 2),
             'baseline_std': round(self.baseline_std, 2),
             'is_baseline_ready': self.is_baseline_ready,
             'max_anomaly_streak': self.max_anomaly_streak,
             'current_streak': self.current_anomaly_streak
         }
+        self._stats_cache = (version, stats)
+        return stats
     
     def reset_stats(self):
         """Reset statistics (useful for testing)"""
-        self.stats = TransmissionStats()
+        self.stats = TransmissionStats(frame_size=self.frame_size_bytes)
+        self._stats_version += 1
         logger.info("📊 Statistics reset")
     
     def get_efficiency_report(self) -> str:
@@ -282,6 +414,11 @@ class AnomalyDrivenTransmitter:
         Returns:
             Formatted report string
         """
+        version = self._stats_version
+        cached_version, cached = self._report_cache
+        if cached_version == version:
+            return cached
+        
         stats = self.get_stats()
         
         report = f"""
@@ -307,6 +444,7 @@ class AnomalyDrivenTransmitter:
    
 ✅ Status: {'Baseline Ready' if stats['is_baseline_ready'] else 'Building Baseline'}
         """
+        self._report_cache = (version, report)
         return report
 
 
@@ -324,6 +462,8 @@ def test_anomaly_transmitter():
     
     print("Simulating 100 frames of traffic...\n")
     
+    vehicle_trace = []
+    
     # Simulate normal traffic with occasional spikes
     for frame_num in range(100):
         # Normal traffic: 5-15 vehicles
@@ -331,6 +471,7 @@ def test_anomaly_transmitter():
             vehicle_count = random.randint(5, 15)
         else:  # 10% anomaly (traffic jam)
             vehicle_count = random.randint(25, 40)
+        vehicle_trace.append(vehicle_count)
         
         # Create mock detections
         detections = [
@@ -347,6 +488,11 @@ def test_anomaly_transmitter():
     
     # Print final report
     print(transmitter.get_efficiency_report())
+    
+    # Cross-check the streaming decisions with the batched replay kernel
+    anomaly_mask, _ = transmitter.replay(vehicle_trace)
+    print(f"Batched replay: {int(anomaly_mask.sum())} anomalies "
+          f"(streaming: {transmitter.stats.anomalies_detected})")
 
 
 if __name__ == "__main__":
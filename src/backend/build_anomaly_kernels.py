@@ -0,0 +1,33 @@
+"""
+EDGE-QI Anomaly Kernel AOT Build
+Compiles the replay kernel into a native extension with numba.pycc
+
+Run once per target platform (e.g. as part of the device image build):
+
+    python build_anomaly_kernels.py
+
+The resulting anomaly_kernels.*.so / .pyd is written next to this file and is
+picked up by _anomaly_kernels.py in preference to the numba JIT, so the edge
+node never pays JIT compilation or cache loading on first use.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from _anomaly_kernels import _rolling_zscore_anomalies_py
+
+cc = CC('anomaly_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+# fastmath stays off, same as the JIT path (keeps parity with the streaming
+# transmitter on threshold-boundary frames)
+
+cc.export(
+    'rolling_zscore_anomalies',
+    'Tuple((b1[:], f8[:]))(i8[:], i8, f8, i8)'
+)(_rolling_zscore_anomalies_py)
+
+
+if __name__ == '__main__':
+    cc.compile()
+    print(f"✅ Built {cc.name} in {cc.output_dir}")
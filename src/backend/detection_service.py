@@ -8,8 +8,12 @@ import torch
 import numpy as np
 from typing import List, Dict, Optional, Callable
 import asyncio
+import concurrent.futures
 from datetime import datetime
 import logging
+import queue
+import threading
+import time
 from pathlib import Path
 
 # Try to import YOLO, fallback to mock if not available
@@ -23,6 +27,11 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Seeded generator for the synthetic detections used when no model is loaded,
+# so mock runs are reproducible (same seed as populate_db.py)
+MOCK_SEED = 42
+_mock_rng = np.random.default_rng(MOCK_SEED)
+
 
 class YOLODetectionService:
     """Real-time YOLOv8 detection service for edge devices"""
@@ -41,11 +50,38 @@ class YOLODetectionService:
         9: 'motor'
     }
     
+    # Export format and artifact suffix per inference backend
+    EXPORT_FORMATS = {
+        'tensorrt': ('engine', '.engine'),
+        'onnx': ('onnx', '.onnx'),
+        'openvino': ('openvino', '_openvino_model'),
+        'coreml': ('coreml', '.mlpackage'),
+    }
+    
+    # BGR drawing colors per class
+    CLASS_COLORS = {
+        'car': (0, 255, 0),      # Green
+        'person': (255, 0, 0),    # Blue
+        'pedestrian': (255, 0, 0),
+        'bicycle': (0, 255, 255), # Yellow
+        'bus': (255, 165, 0),     # Orange
+        'truck': (255, 0, 255),   # Magenta
+        'van': (0, 128, 255),     # Light blue
+    }
+    
     def __init__(self, 
                  model_path: str = "yolov8n.pt",
                  device: str = "auto",
                  conf_threshold: float = 0.25,
-                 iou_threshold: float = 0.45):
+                 iou_threshold: float = 0.45,
+                 precision: str = "fp16",
+                 engine_path: Optional[str] = None,
+                 calib_data: Optional[str] = None,
+                 backend: str = "torch",
+                 max_batch: int = 1,
+                 imgsz: int = 640,
+                 compile_model: bool = False,
+                 pinned_upload: bool = False):
         """
         Initialize YOLOv8 detection service
         
@@ -54,11 +90,43 @@ class YOLODetectionService:
             device: 'cuda', 'cpu', 'mps', or 'auto' (auto-detect)
             conf_threshold: Minimum confidence for detections (0.0-1.0)
             iou_threshold: IoU threshold for NMS
+            precision: 'fp32', 'fp16' or 'int8' (precision of the exported model)
+            engine_path: Optional exported model path (default: sibling of model_path)
+            calib_data: Dataset YAML used for INT8 calibration
+            backend: 'torch' (default), 'tensorrt', 'onnx', 'openvino', 'coreml',
+                or 'auto' (TensorRT on CUDA, CoreML on Apple Silicon, ONNX
+                Runtime on CPU). Exporting can take minutes on first use; an
+                explicitly requested backend that can't be built raises
+                RuntimeError, 'auto' falls back to torch with a warning
+            max_batch: Largest batch detect_batch will send; > 1 exports a
+                dynamic-batch model
+            imgsz: Model input size (frames much larger are downscaled first)
+            compile_model: torch.compile the PyTorch model on CUDA/MPS (ignored
+                for exported backends; the first warmup pass pays the compile)
+            pinned_upload: On CUDA, letterbox single frames into a pinned host
+                buffer and upload them on a dedicated copy stream
         """
+        if precision not in ("fp32", "fp16", "int8"):
+            raise ValueError(f"Unsupported precision: {precision}")
+        if backend != "auto" and backend != "torch" and backend not in self.EXPORT_FORMATS:
+            raise ValueError(f"Unsupported backend: {backend}")
+        
         self.conf_threshold = conf_threshold
         self.iou_threshold = iou_threshold
+        self.precision = precision
+        self.engine_path = engine_path
+        self.calib_data = calib_data
+        self.max_batch = max_batch
+        self.imgsz = imgsz
+        self.compile_model = compile_model
+        self.pinned_upload = pinned_upload
+        self._host_buf = None  # Pinned-upload buffers, see _init_pinned_buffers
         self.model = None
         self.device = self._select_device(device)
+        self.requested_backend = backend
+        self.backend = self._select_backend(backend)
+        self._label_widths: Dict[str, int] = {}  # draw_detections text-width cache
+        self._annot_buf: Optional[np.ndarray] = None  # draw_detections output buffer
         
         # Statistics
         self.stats = {
@@ -68,6 +136,12 @@ class YOLODetectionService:
             'avg_inference_time': 0.0
         }
         
+        # Single inference thread: keeps detect_frame off the event loop and
+        # serializes access to the model
+        self._infer_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="yolo-infer"
+        )
+        
         # Load model
         self._load_model(model_path)
     
@@ -89,26 +163,208 @@ class YOLODetectionService:
             logger.info("Install with: pip install ultralytics")
             return
         
+        # Check if model exists
+        if not Path(model_path).exists() and not model_path.startswith('yolov8'):
+            logger.warning(f"⚠️  Model not found at {model_path}, using yolov8n.pt")
+            model_path = "yolov8n.pt"
+        
+        # Outside the try below: a backend that was asked for explicitly but
+        # can't be provided is a configuration error, not a reason for mock mode
+        exported = self._resolve_export(model_path)
+        
         try:
-            # Check if model exists
-            if not Path(model_path).exists() and not model_path.startswith('yolov8'):
-                logger.warning(f"⚠️  Model not found at {model_path}, using yolov8n.pt")
-                model_path = "yolov8n.pt"
-            
-            self.model = YOLO(model_path)
-            self.model.to(self.device)
-            
-            # Enable FP16 for CUDA
-            if self.device == "cuda":
-                self.model.half()
+            if exported is not None:
+                # Exported model: precision and execution provider are baked
+                # in at export, Ultralytics picks the matching runtime
+                self.model = YOLO(exported, task='detect')
+                model_path = exported
+            else:
+                self.model = YOLO(model_path)
+                self.model.to(self.device)
+                
+                # Enable FP16 for CUDA
+                if self.device == "cuda" and self.precision != "fp32":
+                    self.model.half()
+                
+                if self.compile_model:
+                    self._compile_torch_model()
             
             logger.info(f"✅ YOLOv8 model loaded successfully on {self.device}")
+            logger.info(f"   Backend: {self.backend} ({self._served_precision()})")
+            if self._served_precision() != self.precision:
+                logger.warning(f"⚠️  {self.precision} not available for {self.backend} "
+                               f"on {self.device}; running {self._served_precision()}")
             logger.info(f"   Model: {model_path}")
             logger.info(f"   Confidence: {self.conf_threshold}")
             
         except Exception as e:
             logger.error(f"❌ Failed to load model: {e}")
             self.model = None
+            return
+        
+        if self.pinned_upload and self.device == "cuda":
+            self._init_pinned_buffers()
+        
+        # Warmup only pays off where there is lazy device init / autotuning
+        # (or a torch.compile to trigger); on CPU it just delays startup
+        if self.device != "cpu":
+            self._warmup()
+    
+    def _compile_torch_model(self):
+        """Fuse the PyTorch graph with torch.compile (inductor) when supported"""
+        if not hasattr(torch, 'compile') or self.device not in ("cuda", "mps"):
+            logger.info("   torch.compile skipped (needs PyTorch 2.x on CUDA/MPS)")
+            return
+        try:
+            self.model.model = torch.compile(self.model.model, mode='reduce-overhead', fullgraph=False)
+            logger.info("   torch.compile enabled (compiles during warmup)")
+        except Exception as e:
+            logger.warning(f"⚠️  torch.compile failed, running eager: {e}")
+    
+    def _init_pinned_buffers(self):
+        """Allocate the reusable letterbox / pinned host / device input buffers"""
+        try:
+            dtype = torch.float32 if self.precision == "fp32" else torch.float16
+            size = self.imgsz
+            self._letterbox_buf = np.full((size, size, 3), 114, dtype=np.uint8)
+            self._host_buf = torch.empty((1, 3, size, size), dtype=dtype, pin_memory=True)
+            self._host_np = self._host_buf.numpy()
+            self._dev_buf = torch.empty_like(self._host_buf, device='cuda')
+            self._copy_stream = torch.cuda.Stream()
+            self._copy_event = torch.cuda.Event()
+            logger.info("   Pinned-memory frame upload enabled")
+        except Exception as e:
+            logger.warning(f"⚠️  Pinned upload unavailable: {e}")
+            self._host_buf = None
+    
+    def _stage_pinned(self, frame: np.ndarray):
+        """
+        Letterbox a BGR frame straight into the pinned buffer and start an
+        async host-to-device copy on the copy stream
+        
+        Returns:
+            Tuple of (device tensor, scale) in the same form as _downscale
+        """
+        h, w = frame.shape[:2]
+        size = self.imgsz
+        ratio = size / max(h, w)
+        new_w, new_h = max(1, round(w * ratio)), max(1, round(h * ratio))
+        pad_x, pad_y = (size - new_w) // 2, (size - new_h) // 2
+        
+        canvas = self._letterbox_buf
+        canvas.fill(114)
+        interpolation = cv2.INTER_AREA if ratio < 1 else cv2.INTER_LINEAR
+        canvas[pad_y:pad_y + new_h, pad_x:pad_x + new_w] = cv2.resize(
+            frame, (new_w, new_h), interpolation=interpolation
+        )
+        
+        # BGR HWC uint8 -> RGB CHW in [0, 1], written into pinned memory
+        np.multiply(canvas[..., ::-1].transpose(2, 0, 1), 1.0 / 255,
+                    out=self._host_np[0], casting='unsafe')
+        
+        with torch.cuda.stream(self._copy_stream):
+            self._dev_buf.copy_(self._host_buf, non_blocking=True)
+            self._copy_event.record(self._copy_stream)
+        torch.cuda.current_stream().wait_event(self._copy_event)
+        
+        return self._dev_buf, (1 / ratio, 1 / ratio, pad_x, pad_y)
+    
+    def _warmup(self, runs: int = 3):
+        """
+        Run dummy inferences so GPU init, cuDNN autotune and workspace
+        allocation happen at startup instead of on the first real frame
+        """
+        dummy = np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8)
+        try:
+            for _ in range(runs):
+                self.model(dummy, conf=self.conf_threshold, iou=self.iou_threshold,
+                           imgsz=self.imgsz, verbose=False)
+            logger.info(f"   Warmed up with {runs} dummy inferences")
+        except Exception as e:
+            logger.warning(f"⚠️  Model warmup failed: {e}")
+    
+    def _select_backend(self, backend: str) -> str:
+        """Pick the inference runtime for the selected device"""
+        if backend == "auto":
+            return {"cuda": "tensorrt", "mps": "coreml"}.get(self.device, "onnx")
+        return backend
+    
+    def _served_precision(self) -> str:
+        """Precision the loaded model actually runs at"""
+        if self.backend == "torch":
+            return "fp16" if self.device == "cuda" and self.precision != "fp32" else "fp32"
+        if self.precision == "fp16" and self.backend == "onnx" and self.device != "cuda":
+            return "fp32"  # FP16 ONNX export needs a GPU
+        if self.precision == "int8" and self.backend == "onnx":
+            return "fp32"  # Ultralytics has no INT8 ONNX export
+        return self.precision
+    
+    def _export_unavailable(self, reason: str) -> None:
+        """
+        Handle a backend that can't be provided: raise if it was requested
+        explicitly, otherwise fall back to the PyTorch weights and say so
+        """
+        if self.requested_backend != "auto" or self.engine_path:
+            raise RuntimeError(f"{self.backend} backend unavailable: {reason}")
+        logger.warning(f"⚠️  {self.backend} backend unavailable ({reason}); "
+                       f"serving PyTorch weights instead")
+        self.backend = "torch"
+        return None
+    
+    def _resolve_export(self, model_path: str) -> Optional[str]:
+        """
+        Find or build the exported model for the selected backend
+        
+        Returns:
+            Exported model path, or None to run the PyTorch weights directly
+        
+        Raises:
+            RuntimeError: An explicitly requested backend or engine_path
+                can't be provided
+        """
+        if self.backend == "torch":
+            return None
+        
+        fmt, suffix = self.EXPORT_FORMATS[self.backend]
+        if model_path.endswith(suffix):
+            return model_path
+        if self.backend == "tensorrt" and self.device != "cuda":
+            return self._export_unavailable("TensorRT needs a CUDA device")
+        
+        if self.engine_path:
+            target = Path(self.engine_path)
+        else:
+            source = Path(model_path)
+            target = source.with_name(source.stem + suffix)
+        if target.exists():
+            logger.info(f"   Using cached {self.backend} model: {target}")
+            return str(target)
+        
+        try:
+            logger.info(f"⚙️  Exporting {self.backend} model ({self.precision}), this runs once...")
+            options = {}
+            if fmt == 'engine':
+                options['workspace'] = 4
+            if self.max_batch > 1 and fmt != 'coreml':
+                options['dynamic'] = True
+            exported = YOLO(model_path).export(
+                format=fmt,
+                # FP16 ONNX export needs a GPU; OpenVINO/CoreML store FP16 weights
+                half=self.precision == "fp16" and (self.device == "cuda" or fmt in ('openvino', 'coreml')),
+                int8=self.precision == "int8" and fmt != 'onnx',
+                data=self.calib_data,
+                imgsz=self.imgsz,
+                batch=self.max_batch,
+                device=0 if self.device == "cuda" else "cpu",
+                **options
+            )
+            if self.engine_path and Path(exported) != target:
+                Path(exported).replace(target)
+                exported = str(target)
+            logger.info(f"   Exported {self.backend} model: {exported}")
+            return str(exported)
+        except Exception as e:
+            return self._export_unavailable(f"export failed: {e}")
     
     def detect_frame(self, 
                     frame: np.ndarray, 
@@ -129,56 +385,27 @@ class YOLODetectionService:
         conf = conf or self.conf_threshold
         
         try:
-            import time
             start_time = time.time()
             
+            if self._host_buf is not None:
+                # Preprocessed tensor: Ultralytics skips its own letterbox/upload
+                frame, scale = self._stage_pinned(frame)
+            else:
+                frame, scale = self._downscale(frame)
+            
             # Run inference
             results = self.model(
                 frame, 
                 conf=conf,
                 iou=self.iou_threshold,
                 verbose=False,
-                imgsz=640  # Input size
+                imgsz=self.imgsz  # Input size
             )[0]
             
             inference_time = time.time() - start_time
             
-            # Parse results
-            detections = []
-            for box in results.boxes:
-                x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                confidence = float(box.conf[0])
-                class_id = int(box.cls[0])
-                
-                # Get class name
-                class_name = self.VISDRONE_CLASSES.get(class_id, f"class_{class_id}")
-                
-                detection = {
-                    "bbox": {
-                        "x": int(x1),
-                        "y": int(y1),
-                        "width": int(x2 - x1),
-                        "height": int(y2 - y1)
-                    },
-                    "center": {
-                        "x": int((x1 + x2) / 2),
-                        "y": int((y1 + y2) / 2)
-                    },
-                    "confidence": round(confidence, 2),
-                    "class_id": class_id,
-                    "class_name": class_name,
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                detections.append(detection)
-            
-            # Update stats
-            self.stats['total_frames'] += 1
-            self.stats['total_detections'] += len(detections)
-            self.stats['avg_inference_time'] = (
-                (self.stats['avg_inference_time'] * (self.stats['total_frames'] - 1) + inference_time) 
-                / self.stats['total_frames']
-            )
-            self.stats['fps'] = 1.0 / inference_time if inference_time > 0 else 0
+            detections = self._parse_result(results, scale)
+            self._update_stats(1, len(detections), inference_time)
             
             return detections
             
@@ -186,27 +413,166 @@ class YOLODetectionService:
             logger.error(f"Detection error: {e}")
             return []
     
-    def _generate_mock_detections(self, frame: np.ndarray) -> List[Dict]:
-        """Generate mock detections if model not available"""
-        import random
+    def detect_batch(self,
+                     frames: List[np.ndarray],
+                     conf: Optional[float] = None) -> List[List[Dict]]:
+        """
+        Run detection on several frames in a single forward pass
         
+        Args:
+            frames: Input images (BGR format, numpy arrays), e.g. one per stream
+            conf: Optional confidence override
+            
+        Returns:
+            Per-frame lists of detection dictionaries, in input order
+        """
+        if self.model is None:
+            return [self._generate_mock_detections(frame) for frame in frames]
+        
+        conf = conf or self.conf_threshold
+        
+        try:
+            start_time = time.time()
+            
+            frames, scales = zip(*(self._downscale(frame) for frame in frames))
+            
+            # Ultralytics letterboxes and stacks the list into one batch tensor
+            results = self.model(
+                list(frames),
+                conf=conf,
+                iou=self.iou_threshold,
+                verbose=False,
+                imgsz=self.imgsz
+            )
+            
+            inference_time = time.time() - start_time
+            
+            batch = [self._parse_result(result, scale) for result, scale in zip(results, scales)]
+            self._update_stats(len(frames), sum(len(dets) for dets in batch), inference_time)
+            
+            return batch
+            
+        except Exception as e:
+            logger.error(f"Batch detection error: {e}")
+            return [[] for _ in frames]
+    
+    async def detect_batch_async(self,
+                                 frames: List[np.ndarray],
+                                 conf: Optional[float] = None) -> List[List[Dict]]:
+        """detect_batch on the inference thread, awaitable from the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._infer_executor, self.detect_batch, frames, conf)
+    
+    def _downscale(self, frame: np.ndarray):
+        """
+        Shrink frames well above the model input size with one cv2 INTER_AREA
+        resize, so Ultralytics only letterboxes an already-small image
+        
+        Returns:
+            Tuple of (frame, scale) where scale = (sx, sy, pad_x, pad_y) maps
+            boxes back to the original frame as (box - pad) * s (None when
+            the frame was left as-is)
+        """
         h, w = frame.shape[:2]
-        num_objects = random.randint(2, 8)
+        if max(h, w) <= self.imgsz * 1.3:
+            return frame, None
+        
+        ratio = self.imgsz / max(h, w)
+        new_w, new_h = max(1, round(w * ratio)), max(1, round(h * ratio))
+        resized = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_AREA)
+        return resized, (w / new_w, h / new_h, 0, 0)
+    
+    def _parse_result(self, results, scale=None) -> List[Dict]:
+        """Convert one Ultralytics result into detection dictionaries"""
+        boxes = results.boxes
+        if len(boxes) == 0:
+            return []
+        
+        # One device->host transfer per tensor instead of three per box
+        xyxy = boxes.xyxy.cpu().numpy()
+        if scale is not None:
+            # Back to original-frame pixels after _downscale / _stage_pinned
+            sx, sy, pad_x, pad_y = scale
+            xyxy = (xyxy - np.array([pad_x, pad_y, pad_x, pad_y], dtype=np.float32)) \
+                * np.array([sx, sy, sx, sy], dtype=np.float32)
+        confs = np.round(boxes.conf.cpu().numpy().astype(np.float64), 2)
+        class_ids = boxes.cls.cpu().numpy().astype(np.int64)
+        
+        x1, y1, x2, y2 = xyxy.T
+        xs = x1.astype(np.int64)
+        ys = y1.astype(np.int64)
+        widths = (x2 - x1).astype(np.int64)
+        heights = (y2 - y1).astype(np.int64)
+        cxs = ((x1 + x2) / 2).astype(np.int64)
+        cys = ((y1 + y2) / 2).astype(np.int64)
+        
+        # All boxes of a frame share one timestamp
+        timestamp = datetime.utcnow().isoformat()
         
         detections = []
-        for i in range(num_objects):
-            x = random.randint(50, w - 150)
-            y = random.randint(50, h - 150)
-            width = random.randint(60, 120)
-            height = random.randint(40, 80)
+        for x, y, width, height, cx, cy, confidence, class_id in zip(
+                xs.tolist(), ys.tolist(), widths.tolist(), heights.tolist(),
+                cxs.tolist(), cys.tolist(), confs.tolist(), class_ids.tolist()):
+            # Get class name
+            class_name = self.VISDRONE_CLASSES.get(class_id, f"class_{class_id}")
             
+            detection = {
+                "bbox": {
+                    "x": x,
+                    "y": y,
+                    "width": width,
+                    "height": height
+                },
+                "center": {
+                    "x": cx,
+                    "y": cy
+                },
+                "confidence": confidence,
+                "class_id": class_id,
+                "class_name": class_name,
+                "timestamp": timestamp
+            }
+            detections.append(detection)
+        
+        return detections
+    
+    def _update_stats(self, num_frames: int, num_detections: int, inference_time: float):
+        """Fold one forward pass (covering num_frames frames) into the stats"""
+        per_frame_time = inference_time / num_frames
+        prev_frames = self.stats['total_frames']
+        self.stats['total_frames'] += num_frames
+        self.stats['total_detections'] += num_detections
+        self.stats['avg_inference_time'] = (
+            (self.stats['avg_inference_time'] * prev_frames + per_frame_time * num_frames)
+            / self.stats['total_frames']
+        )
+        self.stats['fps'] = num_frames / inference_time if inference_time > 0 else 0
+    
+    def _generate_mock_detections(self, frame: np.ndarray) -> List[Dict]:
+        """Generate mock detections if model not available"""
+        h, w = frame.shape[:2]
+        num_objects = int(_mock_rng.integers(2, 9))
+        timestamp = datetime.utcnow().isoformat()
+        
+        # Draw all objects' fields at once, then zip into dicts
+        xs = _mock_rng.integers(50, w - 149, num_objects).tolist()
+        ys = _mock_rng.integers(50, h - 149, num_objects).tolist()
+        widths = _mock_rng.integers(60, 121, num_objects).tolist()
+        heights = _mock_rng.integers(40, 81, num_objects).tolist()
+        confidences = np.round(_mock_rng.uniform(0.3, 0.95, num_objects), 2).tolist()
+        class_ids = _mock_rng.choice([3, 0, 2], num_objects).tolist()  # car, person, bicycle
+        class_names = _mock_rng.choice(['car', 'pedestrian', 'bicycle'], num_objects).tolist()
+        
+        detections = []
+        for x, y, width, height, confidence, class_id, class_name in zip(
+                xs, ys, widths, heights, confidences, class_ids, class_names):
             detections.append({
                 "bbox": {"x": x, "y": y, "width": width, "height": height},
                 "center": {"x": x + width // 2, "y": y + height // 2},
-                "confidence": round(random.uniform(0.3, 0.95), 2),
-                "class_id": random.choice([3, 0, 2]),  # car, person, bicycle
-                "class_name": random.choice(['car', 'pedestrian', 'bicycle']),
-                "timestamp": datetime.utcnow().isoformat()
+                "confidence": confidence,
+                "class_id": class_id,
+                "class_name": class_name,
+                "timestamp": timestamp
             })
         
         return detections
@@ -215,21 +581,43 @@ class YOLODetectionService:
                                    source: str,
                                    callback: Callable,
                                    target_fps: int = 5,
-                                   node_id: str = "edge-node-1"):
+                                   node_id: str = "edge-node-1",
+                                   prefetch: int = 4,
+                                   batch_collector: Optional["BatchCollector"] = None):
         """
         Process video stream continuously
         
+        Runs as a three-stage pipeline so decode, inference and the callback
+        overlap instead of running back to back:
+            reader thread (cap.read) -> inference (this task) -> callback task
+        Stages are connected by bounded queues, which provide backpressure.
+        
         Args:
             source: Camera index (0, 1), video file path, or RTSP URL
             callback: Async function called with (frame, detections, frame_count)
             target_fps: Target processing FPS (actual camera FPS may be higher)
             node_id: Identifier for this edge node
+            prefetch: Maximum frames buffered between pipeline stages
+            batch_collector: Optional BatchCollector shared by several streams so
+                their frames go through YOLO together
         """
         cap = None
+        reader_thread = None
+        writer_task = None
+        stop = threading.Event()
+        # Set on an error: queued results are then discarded, not delivered
+        failed = threading.Event()
+        finished = False  # source ended cleanly; the writer delivers the rest
+        read_q = queue.Queue(maxsize=prefetch)
+        write_q = asyncio.Queue(maxsize=prefetch)
         try:
             # Open video source
             if isinstance(source, int) or source.isdigit():
                 cap = cv2.VideoCapture(int(source))
+                # Ask the webcam for a mode near the model input size instead
+                # of decoding full resolution only to downscale it
+                cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.imgsz)
+                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.imgsz * 3 // 4)
             else:
                 cap = cv2.VideoCapture(source)
             
@@ -249,30 +637,96 @@ class YOLODetectionService:
             logger.info(f"   Camera FPS: {camera_fps}")
             logger.info(f"   Processing every {frame_skip} frames for {target_fps} FPS")
             
-            frame_count = 0
+            def put_frame(item) -> bool:
+                """Blocking put that gives up once the pipeline is stopping"""
+                while not stop.is_set():
+                    try:
+                        read_q.put(item, timeout=0.1)
+                        return True
+                    except queue.Full:
+                        continue
+                return False
+            
+            def reader():
+                """Stage 1: decode frames and hand every Nth one to inference"""
+                frame_count = 0
+                try:
+                    while not stop.is_set():
+                        ret, frame = cap.read()
+                        if not ret:
+                            logger.warning("End of stream or read error")
+                            break
+                        
+                        frame_count += 1
+                        
+                        # Process every Nth frame
+                        if frame_count % frame_skip == 0:
+                            put_frame((frame_count, frame))
+                except Exception as e:
+                    logger.error(f"Stream read error: {e}")
+                finally:
+                    # End-of-stream sentinel. When stopping, a full queue means
+                    # the consumer's pending get() returns anyway.
+                    if not put_frame(None):
+                        try:
+                            read_q.put_nowait(None)
+                        except queue.Full:
+                            pass
             
-            while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
-                    logger.warning("End of stream or read error")
+            async def writer():
+                """Stage 3: deliver results to the callback in frame order"""
+                while True:
+                    item = await write_q.get()
+                    if item is None:
+                        return
+                    if failed.is_set():
+                        continue  # Drain without delivering after a failure
+                    frame, detections, frame_count = item
+                    try:
+                        await callback(frame, detections, frame_count, node_id)
+                    except Exception as e:
+                        logger.error(f"Stream callback error: {e}")
+                        failed.set()
+                        stop.set()
+            
+            reader_thread = threading.Thread(target=reader, daemon=True)
+            reader_thread.start()
+            writer_task = asyncio.create_task(writer())
+            
+            # Stage 2: inference
+            loop = asyncio.get_running_loop()
+            while not stop.is_set():
+                item = await loop.run_in_executor(None, read_q.get)
+                if item is None:
+                    finished = True
                     break
                 
-                frame_count += 1
+                frame_count, frame = item
                 
-                # Process every Nth frame
-                if frame_count % frame_skip == 0:
-                    # Run detection
-                    detections = self.detect_frame(frame)
-                    
-                    # Call callback with results
-                    await callback(frame, detections, frame_count, node_id)
+                # Run detection
+                if batch_collector is not None:
+                    detections = await batch_collector.detect(frame)
+                else:
+                    detections = await loop.run_in_executor(
+                        self._infer_executor, self.detect_frame, frame
+                    )
                 
-                # Small delay to prevent CPU thrashing
-                await asyncio.sleep(0.01)
+                await write_q.put((frame, detections, frame_count))
                 
         except Exception as e:
             logger.error(f"Stream processing error: {e}")
         finally:
+            if not finished:
+                failed.set()
+            stop.set()
+            if writer_task is not None:
+                # On a clean end the writer still delivers the queued results
+                await write_q.put(None)
+                await writer_task
+            if reader_thread is not None:
+                # cap.read() can block up to the backend's timeout on a stalled
+                # source; wait for it off the event loop
+                await asyncio.get_running_loop().run_in_executor(None, reader_thread.join)
             if cap is not None:
                 cap.release()
             logger.info(f"Video stream closed: {source}")
@@ -289,7 +743,8 @@ class YOLODetectionService:
     def draw_detections(self, 
                        frame: np.ndarray, 
                        detections: List[Dict],
-                       show_confidence: bool = True) -> np.ndarray:
+                       show_confidence: bool = True,
+                       inplace: bool = False) -> np.ndarray:
         """
         Draw bounding boxes on frame
         
@@ -297,29 +752,54 @@ class YOLODetectionService:
             frame: Input image
             detections: List of detections
             show_confidence: Show confidence scores
+            inplace: Draw directly on frame instead of a copy (saves a
+                full-frame memcpy when the caller doesn't need the original)
             
         Returns:
-            Frame with drawn boxes
+            Frame with drawn boxes. Unless inplace, this is a buffer reused
+            by the next call: encode/send it before drawing the next frame.
         """
-        result = frame.copy()
+        if inplace:
+            result = frame
+        else:
+            if (self._annot_buf is None or self._annot_buf.shape != frame.shape
+                    or self._annot_buf.dtype != frame.dtype):
+                self._annot_buf = np.empty_like(frame)
+            np.copyto(self._annot_buf, frame)
+            result = self._annot_buf
+        if not detections:
+            return result
+        
+        # Color based on class
+        colors = [self._get_color_for_class(det['class_name']) for det in detections]
         
-        for det in detections:
+        # Draw bounding boxes: one polylines call per color instead of one
+        # rectangle call per box
+        by_color = {}
+        for det, color in zip(detections, colors):
             bbox = det['bbox']
-            x, y, w, h = bbox['x'], bbox['y'], bbox['width'], bbox['height']
-            
-            # Color based on class
-            color = self._get_color_for_class(det['class_name'])
-            
-            # Draw bounding box
-            cv2.rectangle(result, (x, y), (x + w, y + h), color, 2)
+            by_color.setdefault(color, []).append(
+                (bbox['x'], bbox['y'], bbox['width'], bbox['height'])
+            )
+        for color, boxes in by_color.items():
+            x, y, w, h = np.array(boxes, dtype=np.int32).T
+            corners = np.stack([x, y, x + w, y, x + w, y + h, x, y + h], axis=1)
+            cv2.polylines(result, list(corners.reshape(-1, 4, 2)), True, color, 2)
+        
+        for det, color in zip(detections, colors):
+            x, y = det['bbox']['x'], det['bbox']['y']
             
             # Draw label
             label = f"{det['class_name']}"
             if show_confidence:
                 label += f" {det['confidence']:.2f}"
             
-            # Background for text
-            (text_w, text_h), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+            # Background for text (label sizes are cached; class x 2-decimal
+            # confidence is a small, bounded set)
+            text_w = self._label_widths.get(label)
+            if text_w is None:
+                (text_w, _), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+                self._label_widths[label] = text_w
             cv2.rectangle(result, (x, y - 20), (x + text_w, y), color, -1)
             
             # Draw text
@@ -330,16 +810,110 @@ class YOLODetectionService:
     
     def _get_color_for_class(self, class_name: str) -> tuple:
         """Get color for class"""
-        colors = {
-            'car': (0, 255, 0),      # Green
-            'person': (255, 0, 0),    # Blue
-            'pedestrian': (255, 0, 0),
-            'bicycle': (0, 255, 255), # Yellow
-            'bus': (255, 165, 0),     # Orange
-            'truck': (255, 0, 255),   # Magenta
-            'van': (0, 128, 255),     # Light blue
-        }
-        return colors.get(class_name.lower(), (128, 128, 128))
+        return self.CLASS_COLORS.get(class_name.lower(), (128, 128, 128))
+
+
+class BatchCollector:
+    """
+    Aggregates frames from several streams into shared YOLO forward passes
+    
+    Each process_video_stream task awaits detect(); frames are flushed to
+    YOLODetectionService.detect_batch once max_batch frames are waiting or
+    max_wait_ms has passed since the first one arrived.
+    """
+    
+    def __init__(self,
+                 service: YOLODetectionService,
+                 max_batch: Optional[int] = None,
+                 max_wait_ms: float = 10.0):
+        """
+        Initialize batch collector
+        
+        Args:
+            service: Detection service that runs the batched inference
+            max_batch: Maximum frames per forward pass; defaults to (and is
+                capped at) service.max_batch, the batch size its exported
+                engine was built for
+            max_wait_ms: Maximum time the first queued frame waits for company
+        """
+        if max_batch is None:
+            max_batch = service.max_batch
+        elif max_batch > service.max_batch:
+            logger.warning(f"BatchCollector max_batch {max_batch} exceeds the "
+                           f"service's {service.max_batch}; capping")
+            max_batch = service.max_batch
+        self.service = service
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._batch: List = []  # frames taken off the queue, not yet answered
+    
+    def start(self):
+        """Start the flush loop on the running event loop"""
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the flush loop and fail every frame still waiting on it"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            
+            pending = self._batch
+            self._batch = []
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            error = RuntimeError("BatchCollector stopped")
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+    
+    async def detect(self, frame: np.ndarray) -> List[Dict]:
+        """Queue a frame for the next batch and wait for its detections"""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((frame, future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = self._batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # A list, not an np.stack'ed array: streams may differ in
+            # resolution, and detect_batch downscales each frame on its own
+            # before Ultralytics letterboxes them into one batch tensor, so a
+            # stacked copy would only add a full-batch memcpy
+            frames = [frame for frame, _ in batch]
+            try:
+                # Inference runs off the event loop so streams keep decoding
+                results = await self.service.detect_batch_async(frames)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), detections in zip(batch, results):
+                if not future.done():
+                    future.set_result(detections)
+            self._batch = []
 
 
 # Convenience function for quick testing
@@ -351,7 +925,7 @@ async def test_detection_service():
     
     async def display_callback(frame, detections, frame_count, node_id):
         """Display detections in window"""
-        annotated = detector.draw_detections(frame, detections)
+        annotated = detector.draw_detections(frame, detections, inplace=True)
         cv2.imshow('EDGE-QI Detection', annotated)
         
         print(f"Frame {frame_count}: {len(detections)} objects detected")
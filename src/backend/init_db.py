@@ -19,13 +19,16 @@ def init_database():
     print("")
     
     try:
-        # Create all tables
+        # Create all tables and indexes in one transaction
         print("Creating tables...")
-        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            Base.metadata.create_all(bind=conn)
         
         print("✅ Tables created successfully:")
         for table in Base.metadata.sorted_tables:
             print(f"   - {table.name}")
+            for index in sorted(table.indexes, key=lambda ix: ix.name or ""):
+                print(f"       index {index.name} ({', '.join(c.name for c in index.columns)})")
         
         print("")
         print("✅ Database initialization complete!")
@@ -2,40 +2,56 @@
 Populate database with mock data for testing
 """
 import sys
-import random
 from pathlib import Path
 from datetime import datetime, timedelta
 
+import numpy as np
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.database import SessionLocal
 from src.models import EdgeNode, Detection, SystemMetric, ConsensusRound, SystemLog
 
+# Seeded generator: columns are drawn in bulk and runs are reproducible
+SEED = 42
+rng = np.random.default_rng(SEED)
+
 
 def create_mock_nodes(db, count=5):
     """Create mock edge nodes"""
     print(f"Creating {count} mock edge nodes...")
     
+    statuses = rng.choice(['active', 'idle'], count).tolist()
+    cpu = rng.uniform(20, 80, count).tolist()
+    memory = rng.uniform(30, 70, count).tolist()
+    gpu = rng.uniform(10, 90, count).tolist()
+    energy = rng.uniform(50, 150, count).tolist()
+    total_detections = rng.integers(100, 1001, count).tolist()
+    latency = rng.uniform(10, 100, count).tolist()
+    uptime = rng.uniform(50, 100, count).tolist()
+    heartbeat_age = rng.integers(0, 61, count).tolist()
+    now = datetime.utcnow()
+    
     nodes = []
     for i in range(count):
         node = EdgeNode(
             id=f"edge-node-{i+1}",
             name=f"Edge Node {i+1}",
-            status=random.choice(['active', 'idle']) if i < count-1 else 'fault',
+            status=statuses[i] if i < count-1 else 'fault',
             location=f"Location {i+1}",
-            cpu_usage=random.uniform(20, 80),
-            memory_usage=random.uniform(30, 70),
-            gpu_usage=random.uniform(10, 90),
+            cpu_usage=cpu[i],
+            memory_usage=memory[i],
+            gpu_usage=gpu[i],
             network_status='good' if i < count-1 else 'poor',
-            energy_consumption=random.uniform(50, 150),
+            energy_consumption=energy[i],
             ip_address=f"192.168.1.{10+i}",
             port=8080 + i,
             capabilities={"detection": True, "tracking": True, "yolo": "v8"},
-            total_detections=random.randint(100, 1000),
-            average_latency=random.uniform(10, 100),
-            uptime=random.uniform(50, 100),
-            last_heartbeat=datetime.utcnow() - timedelta(seconds=random.randint(0, 60))
+            total_detections=total_detections[i],
+            average_latency=latency[i],
+            uptime=uptime[i],
+            last_heartbeat=now - timedelta(seconds=heartbeat_age[i])
         )
         db.add(node)
         nodes.append(node)
@@ -51,25 +67,44 @@ def create_mock_detections(db, nodes, count=50):
     
     object_types = ['car', 'person', 'bicycle', 'motorcycle', 'bus', 'truck', 'traffic_light']
     
-    for i in range(count):
-        detection = Detection(
-            timestamp=datetime.utcnow() - timedelta(minutes=random.randint(0, 120)),
-            node_id=random.choice(nodes).id,
-            stream_id=f"stream-{random.randint(1, 3)}",
-            object_type=random.choice(object_types),
-            confidence=random.uniform(0.7, 0.99),
+    # Draw every column in one vectorized call (.tolist() gives plain
+    # Python values for the DB driver and JSON columns)
+    minutes_ago = rng.integers(0, 121, count).tolist()
+    node_ids = rng.choice([node.id for node in nodes], count).tolist()
+    streams = rng.integers(1, 4, count).tolist()
+    types = rng.choice(object_types, count).tolist()
+    confidences = rng.uniform(0.7, 0.99, count).tolist()
+    xs = rng.integers(0, 1001, count).tolist()
+    ys = rng.integers(0, 1001, count).tolist()
+    widths = rng.integers(50, 201, count).tolist()
+    heights = rng.integers(50, 201, count).tolist()
+    locations = rng.integers(1, 6, count).tolist()
+    verified = (rng.random(count) < 0.5).tolist()
+    consensus_confidences = rng.uniform(0.8, 1.0, count).tolist()
+    now = datetime.utcnow()
+    
+    # Plain row dicts inserted in one bulk statement (no per-row ORM objects)
+    rows = [
+        dict(
+            timestamp=now - timedelta(minutes=minutes_ago[i]),
+            node_id=node_ids[i],
+            stream_id=f"stream-{streams[i]}",
+            object_type=types[i],
+            confidence=confidences[i],
             bbox={
-                "x": random.randint(0, 1000),
-                "y": random.randint(0, 1000),
-                "width": random.randint(50, 200),
-                "height": random.randint(50, 200)
+                "x": xs[i],
+                "y": ys[i],
+                "width": widths[i],
+                "height": heights[i]
             },
-            location=f"Location {random.randint(1, 5)}",
-            consensus_verified=random.choice([True, False]),
-            consensus_confidence=random.uniform(0.8, 1.0),
+            location=f"Location {locations[i]}",
+            consensus_verified=verified[i],
+            consensus_confidence=consensus_confidences[i],
             metadata={"frame": i, "source": "yolov8"}
         )
-        db.add(detection)
+        for i in range(count)
+    ]
+    db.bulk_insert_mappings(Detection, rows)
     
     db.commit()
     print(f"✅ Created {count} detections")
@@ -79,23 +114,37 @@ def create_mock_metrics(db, count=20):
     """Create mock system metrics"""
     print(f"Creating {count} mock system metrics...")
     
-    for i in range(count):
-        metric = SystemMetric(
-            timestamp=datetime.utcnow() - timedelta(minutes=i*5),
+    active = rng.integers(3, 6, count).tolist()
+    idle = rng.integers(0, 3, count).tolist()
+    fault = rng.integers(0, 2, count).tolist()
+    total_detections = rng.integers(50, 201, count).tolist()
+    per_second = rng.uniform(0.5, 5.0, count).tolist()
+    latency = rng.uniform(20, 80, count).tolist()
+    cpu = rng.uniform(30, 70, count).tolist()
+    memory = rng.uniform(40, 80, count).tolist()
+    bandwidth = rng.uniform(10, 100, count).tolist()
+    energy = rng.uniform(0.5, 5.0, count).tolist()
+    now = datetime.utcnow()
+    
+    rows = [
+        dict(
+            timestamp=now - timedelta(minutes=i*5),
             total_nodes=5,
-            active_nodes=random.randint(3, 5),
-            idle_nodes=random.randint(0, 2),
-            fault_nodes=random.randint(0, 1),
-            total_detections=random.randint(50, 200),
-            detections_per_second=random.uniform(0.5, 5.0),
-            average_latency=random.uniform(20, 80),
-            average_cpu=random.uniform(30, 70),
-            average_memory=random.uniform(40, 80),
-            bandwidth_saved=random.uniform(10, 100),
-            energy_saved=random.uniform(0.5, 5.0),
+            active_nodes=active[i],
+            idle_nodes=idle[i],
+            fault_nodes=fault[i],
+            total_detections=total_detections[i],
+            detections_per_second=per_second[i],
+            average_latency=latency[i],
+            average_cpu=cpu[i],
+            average_memory=memory[i],
+            bandwidth_saved=bandwidth[i],
+            energy_saved=energy[i],
             metadata={}
         )
-        db.add(metric)
+        for i in range(count)
+    ]
+    db.bulk_insert_mappings(SystemMetric, rows)
     
     db.commit()
     print(f"✅ Created {count} metrics")
@@ -105,23 +154,31 @@ def create_mock_consensus_rounds(db, count=10):
     """Create mock consensus rounds"""
     print(f"Creating {count} mock consensus rounds...")
     
+    successes = (rng.random(count) < 0.75).tolist()  # 75% success rate
+    participants = rng.integers(3, 6, count).tolist()
+    durations = rng.integers(50, 201, count).tolist()
+    voters = rng.integers(4, 6, count).tolist()
+    values = rng.integers(1, 101, count).tolist()
+    byzantine = rng.integers(1, 6, count).tolist()
+    tolerance = rng.uniform(0.7, 1.0, count).tolist()
+    now = datetime.utcnow()
+    
+    rows = []
     for i in range(count):
-        success = random.choice([True, True, True, False])  # 75% success rate
-        round_data = ConsensusRound(
+        success = successes[i]
+        votes = rng.choice(['accept', 'reject'], voters[i] - 1).tolist()
+        rows.append(dict(
             round_number=i + 1,
-            timestamp=datetime.utcnow() - timedelta(minutes=i*2),
+            timestamp=now - timedelta(minutes=i*2),
             success=success,
-            participants=random.randint(3, 5),
-            duration_ms=random.randint(50, 200),
-            votes={
-                f"node-{j}": random.choice(['accept', 'reject'])
-                for j in range(1, random.randint(4, 6))
-            },
-            result={"consensus": "reached" if success else "failed", "value": random.randint(1, 100)},
-            byzantine_nodes=[] if success else [f"node-{random.randint(1, 5)}"],
-            fault_tolerance_level=random.uniform(0.7, 1.0)
-        )
-        db.add(round_data)
+            participants=participants[i],
+            duration_ms=durations[i],
+            votes={f"node-{j}": vote for j, vote in enumerate(votes, start=1)},
+            result={"consensus": "reached" if success else "failed", "value": values[i]},
+            byzantine_nodes=[] if success else [f"node-{byzantine[i]}"],
+            fault_tolerance_level=tolerance[i]
+        ))
+    db.bulk_insert_mappings(ConsensusRound, rows)
     
     db.commit()
     print(f"✅ Created {count} consensus rounds")
@@ -146,17 +203,27 @@ def create_mock_logs(db, count=30):
         "Alert triggered"
     ]
     
-    for i in range(count):
-        log = SystemLog(
-            timestamp=datetime.utcnow() - timedelta(minutes=i*2),
-            level=random.choice(log_levels),
-            source=random.choice(sources),
-            message=random.choice(messages),
-            node_id=f"edge-node-{random.randint(1, 5)}" if random.random() > 0.3 else None,
-            category=random.choice(['system', 'detection', 'consensus', 'network']),
+    levels = rng.choice(log_levels, count).tolist()
+    log_sources = rng.choice(sources, count).tolist()
+    log_messages = rng.choice(messages, count).tolist()
+    node_numbers = rng.integers(1, 6, count).tolist()
+    has_node = (rng.random(count) > 0.3).tolist()
+    categories = rng.choice(['system', 'detection', 'consensus', 'network'], count).tolist()
+    now = datetime.utcnow()
+    
+    rows = [
+        dict(
+            timestamp=now - timedelta(minutes=i*2),
+            level=levels[i],
+            source=log_sources[i],
+            message=log_messages[i],
+            node_id=f"edge-node-{node_numbers[i]}" if has_node[i] else None,
+            category=categories[i],
             details={"mock": True, "index": i}
         )
-        db.add(log)
+        for i in range(count)
+    ]
+    db.bulk_insert_mappings(SystemLog, rows)
     
     db.commit()
     print(f"✅ Created {count} logs")
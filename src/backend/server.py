@@ -1,14 +1,22 @@
 """
 EDGE-QI Backend API Server - Enhanced with Real Detection
 """
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 import socketio
 from datetime import datetime, timedelta, timezone
-import random
+from collections import OrderedDict, defaultdict
+from types import MappingProxyType
 from typing import Optional
+import numpy as np
 import os
+import time
+import mimetypes
+import hashlib
+from email.utils import formatdate
 import asyncio
 import logging
 
@@ -24,6 +32,46 @@ except ImportError as e:
     print("   pip install ultralytics psutil torch")
     SERVICES_AVAILABLE = False
 
+def _json_default(obj):
+    """Encode the read-only mappings used for the frozen mock data"""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# orjson encodes API responses and Socket.IO packets much faster; stdlib json
+# is the fallback
+try:
+    import orjson
+
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _json_bytes(obj) -> bytes:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTS)
+
+    class _SocketIOJSON:
+        """json-module shim handed to python-socketio"""
+
+        @staticmethod
+        def dumps(obj, **kwargs) -> str:
+            return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTS).decode()
+
+        loads = staticmethod(orjson.loads)
+except ImportError:
+    import json
+
+    def _json_bytes(obj) -> bytes:
+        return json.dumps(obj, default=_json_default, separators=(",", ":")).encode()
+
+    _SocketIOJSON = json
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class: renders through _json_bytes"""
+
+    def render(self, content) -> bytes:
+        return _json_bytes(content)
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -37,12 +85,23 @@ async def lifespan(app: FastAPI):
     # Shutdown (if needed)
     pass
 
+# EDGEQI_ENV=production drops the interactive docs and per-request access logs
+PRODUCTION = os.getenv("EDGEQI_ENV", "development") == "production"
+# Inference runtime for the detection service: 'torch' (default) or an
+# exported backend ('tensorrt', 'onnx', 'openvino', 'coreml', 'auto'). The
+# first start with an exported backend builds and caches the artifact.
+YOLO_BACKEND = os.getenv("YOLO_BACKEND", "torch")
+
 # Create FastAPI app with lifespan
 app = FastAPI(
     title="EDGE-QI API",
     description="Backend for EDGE-QI Smart City Platform",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+    docs_url=None if PRODUCTION else "/docs",
+    redoc_url=None if PRODUCTION else "/redoc",
+    openapi_url=None if PRODUCTION else "/openapi.json"
 )
 
 # CORS middleware
@@ -54,17 +113,120 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress the larger JSON bodies (analytics, detection lists); level 4 keeps
+# the CPU cost low while still shrinking the repetitive keys several-fold
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=4)
+
 # Mount static files for detection images
 # This will serve files from frontend/public/detections
 static_path = os.path.join(os.path.dirname(__file__), "..", "frontend", "public")
+STATIC_CACHE_MAX_FILE = 8 * 1024 * 1024  # larger files are left to StaticFiles
+# Detection snapshots accumulate over time, so only the most recently served
+# ones are kept in memory, bounded by both count and total size
+STATIC_CACHE_MAX_ENTRIES = 256
+STATIC_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# name -> (body, media_type, etag, last_modified), least recently used first
+STATIC_CACHE = OrderedDict()
+_static_cache_bytes = 0
+
+
+def _file_etag(st: os.stat_result) -> str:
+    return f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+def _read_static_file(path: str):
+    """Cache entry for path, or None if it isn't a cacheable regular file"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not os.path.isfile(path) or st.st_size > STATIC_CACHE_MAX_FILE:
+        return None
+    with open(path, "rb") as f:
+        body = f.read()
+    return (
+        body,
+        mimetypes.guess_type(path)[0] or "application/octet-stream",
+        _file_etag(st),
+        formatdate(st.st_mtime, usegmt=True)
+    )
+
+
+def _static_cache_evict(name: str):
+    global _static_cache_bytes
+    old = STATIC_CACHE.pop(name, None)
+    if old is not None:
+        _static_cache_bytes -= len(old[0])
+
+
+def _static_cache_put(name: str, entry: tuple):
+    """Insert entry, evicting least recently used files past the limits"""
+    global _static_cache_bytes
+    _static_cache_evict(name)
+    STATIC_CACHE[name] = entry
+    _static_cache_bytes += len(entry[0])
+    while (len(STATIC_CACHE) > STATIC_CACHE_MAX_ENTRIES
+           or _static_cache_bytes > STATIC_CACHE_MAX_BYTES):
+        _, evicted = STATIC_CACHE.popitem(last=False)
+        _static_cache_bytes -= len(evicted[0])
+
+
 if os.path.exists(static_path):
-    app.mount("/detections", StaticFiles(directory=os.path.join(static_path, "detections")), name="detections")
+    detections_dir = os.path.join(static_path, "detections")
+    detections_files = StaticFiles(directory=detections_dir)
+    
+    @app.api_route("/detections/{name}", methods=["GET", "HEAD"], include_in_schema=False)
+    async def cached_detection_file(name: str, request: Request):
+        """
+        Serve a detection image from the LRU cache; StaticFiles handles
+        misses, HEAD and Range requests
+        """
+        if request.method != "GET" or "range" in request.headers:
+            return await detections_files.get_response(name, request.scope)
+        path = os.path.join(detections_dir, name)
+        cached = STATIC_CACHE.get(name)
+        if cached is not None:
+            # Snapshots can be overwritten in place: drop entries whose file
+            # changed (or vanished) since they were read
+            try:
+                current = _file_etag(os.stat(path))
+            except OSError:
+                current = None
+            if current == cached[2]:
+                STATIC_CACHE.move_to_end(name)
+            else:
+                _static_cache_evict(name)
+                cached = None
+        if cached is None and name not in (".", "..") and os.path.basename(name) == name:
+            cached = await asyncio.to_thread(_read_static_file, path)
+            if cached is not None:
+                _static_cache_put(name, cached)
+        if cached is None:
+            return await detections_files.get_response(name, request.scope)
+        body, media_type, etag, last_modified = cached
+        headers = {"ETag": etag, "Last-Modified": last_modified}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type=media_type, headers=headers)
+    
+    app.mount("/detections", detections_files, name="detections")
 
 # Socket.IO setup
+# Per-packet Socket.IO/Engine.IO logging is for debugging only (SIO_DEBUG=1)
+SIO_DEBUG = os.getenv("SIO_DEBUG", "0") == "1"
+# WS_MSGPACK=1 (same setting as the package app) switches packets to
+# MessagePack (smaller, faster to encode for the metrics/detection events).
+# The serializer is server-wide, so every client must then connect with
+# socket.io-msgpack-parser; JSON is the default.
+WS_MSGPACK = os.getenv("WS_MSGPACK", "0").lower() in ("1", "true")
 sio = socketio.AsyncServer(
     async_mode='asgi',
     cors_allowed_origins='*',
-    logger=True,
+    logger=SIO_DEBUG,
+    engineio_logger=SIO_DEBUG,
+    serializer='msgpack' if WS_MSGPACK else 'default',
+    json=_SocketIOJSON,
 )
 
 socket_app = socketio.ASGIApp(sio, app, socketio_path='/socket.io')
@@ -73,19 +235,87 @@ socket_app = socketio.ASGIApp(sio, app, socketio_path='/socket.io')
 detection_service = None
 system_monitor = None
 anomaly_transmitter = None
+_ds_has_frame_count = False  # resolved once detection_service exists
+
+# Outbound event queue between the simulation loop and sio.emit (created on
+# startup); bounded so a slow client never stalls the producer
+EMIT_QUEUE_SIZE = 2
+EMIT_BATCH_WINDOW = 0.1  # seconds to wait for more events after the first
+EMIT_BATCH_MAX = 16
+# Events whose payloads are partial state: several queued within a window are
+# merged (later keys win) into one emit under the same name
+EMIT_MERGE_EVENTS = ('system_metrics',)
+emit_queue: Optional[asyncio.Queue] = None
+
+# "YYYY-MM-DDTHH:MM:SS" prefix for the current UTC second; rebuilt only when
+# the second ticks, so hot emit paths just append the microseconds
+_iso_sec = None
+_iso_prefix = ""
+
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO 8601 string (same format as isoformat())"""
+    global _iso_sec, _iso_prefix
+    now = time.time()
+    sec = int(now)
+    if sec != _iso_sec:
+        _iso_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _iso_sec = sec
+    return f"{_iso_prefix}.{int((now - sec) * 1_000_000):06d}+00:00"
+
+
+# Number of connected Socket.IO clients; background broadcasters idle at zero
+connected_clients = 0
+
 
 # WebSocket events
 @sio.event
 async def connect(sid, environ):
-    print(f"✅ Client connected: {sid}")
+    global connected_clients
+    connected_clients += 1
+    _last_metric_sections.clear()
+    logger.info("✅ Client connected: %s", sid)
     await sio.emit('connection_established', {
         'status': 'connected',
-        'timestamp': datetime.now(timezone.utc).isoformat()
+        'timestamp': _iso_now()
     }, room=sid)
 
 @sio.event
 async def disconnect(sid):
-    print(f"❌ Client disconnected: {sid}")
+    global connected_clients
+    connected_clients = max(connected_clients - 1, 0)
+    logger.info("❌ Client disconnected: %s", sid)
+
+# Mock data timestamps, computed once at import
+NOW = datetime.now(timezone.utc)
+NOW_ISO = NOW.isoformat()
+DETECTION_TS = {
+    "edge-node-1": (NOW - timedelta(seconds=5)).isoformat(),
+    "edge-node-2": (NOW - timedelta(seconds=8)).isoformat(),
+    "edge-node-3": (NOW - timedelta(seconds=12)).isoformat(),
+    "edge-node-4": (NOW - timedelta(seconds=15)).isoformat(),
+    "edge-node-5": (NOW - timedelta(seconds=20)).isoformat(),
+}
+MOCK_LOG_TS = [(NOW - timedelta(minutes=i*3)).isoformat() for i in range(1, 31)]
+
+# Per-node (low, high) ranges for cpuUsage, memoryUsage, gpuUsage, energyConsumption;
+# all 20 values are drawn in one vectorized call
+_NODE_METRIC_LOWS = np.array([
+    [60, 55, 70, 120],
+    [55, 50, 65, 100],
+    [45, 40, 55, 85],
+    [50, 45, 60, 95],
+    [55, 50, 65, 90],
+])
+_NODE_METRIC_HIGHS = np.array([
+    [85, 75, 90, 150],
+    [75, 70, 85, 130],
+    [65, 60, 75, 110],
+    [70, 65, 80, 120],
+    [75, 70, 85, 115],
+])
+_rng = np.random.default_rng()
+_node_metrics = _rng.uniform(_NODE_METRIC_LOWS, _NODE_METRIC_HIGHS).round(1).tolist()
 
 # Mock data - Real Edge Nodes with Camera Feeds
 MOCK_NODES = [
@@ -97,20 +327,20 @@ MOCK_NODES = [
         "description": "High-traffic urban intersection monitoring. Detects vehicles (cars, buses, trucks) and pedestrians for traffic management and safety.",
         "camera_type": "4K PTZ Camera",
         "camera_view": "Aerial Street View",
-        "cpuUsage": round(random.uniform(60, 85), 1),
-        "memoryUsage": round(random.uniform(55, 75), 1),
-        "gpuUsage": round(random.uniform(70, 90), 1),
+        "cpuUsage": _node_metrics[0][0],
+        "memoryUsage": _node_metrics[0][1],
+        "gpuUsage": _node_metrics[0][2],
         "networkStatus": "excellent",
-        "energyConsumption": round(random.uniform(120, 150), 1),
+        "energyConsumption": _node_metrics[0][3],
         "ip_address": "192.168.1.11",
         "port": 8081,
         "capabilities": {"detection": True, "yolo": "v8n", "classes": ["car", "person", "bicycle", "bus", "truck"]},
         "total_detections": 1847,
         "average_latency": 42.3,
         "uptime": 99.8,
-        "last_heartbeat": datetime.now(timezone.utc).isoformat(),
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "last_heartbeat": NOW_ISO,
+        "created_at": NOW_ISO,
+        "updated_at": NOW_ISO,
         "live_feed": "/detections/intersection_low_traffic.png"
     },
     {
@@ -121,20 +351,20 @@ MOCK_NODES = [
         "description": "Highway traffic monitoring with vehicle classification. Tracks cars, buses, and trucks for traffic flow analysis and incident detection.",
         "camera_type": "Panoramic HD Camera",
         "camera_view": "Highway Overpass View",
-        "cpuUsage": round(random.uniform(55, 75), 1),
-        "memoryUsage": round(random.uniform(50, 70), 1),
-        "gpuUsage": round(random.uniform(65, 85), 1),
+        "cpuUsage": _node_metrics[1][0],
+        "memoryUsage": _node_metrics[1][1],
+        "gpuUsage": _node_metrics[1][2],
         "networkStatus": "good",
-        "energyConsumption": round(random.uniform(100, 130), 1),
+        "energyConsumption": _node_metrics[1][3],
         "ip_address": "192.168.1.12",
         "port": 8082,
         "capabilities": {"detection": True, "yolo": "v8n", "classes": ["car", "bus", "truck"]},
         "total_detections": 2134,
         "average_latency": 38.5,
         "uptime": 98.5,
-        "last_heartbeat": datetime.now(timezone.utc).isoformat(),
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "last_heartbeat": NOW_ISO,
+        "created_at": NOW_ISO,
+        "updated_at": NOW_ISO,
         "live_feed": "/detections/highway_heavy_traffic.png"
     },
     {
@@ -145,20 +375,20 @@ MOCK_NODES = [
         "description": "Parking lot surveillance with vehicle and micro-mobility detection. Monitors cars, vans, and tricycles for security and space management.",
         "camera_type": "Fixed Dome Camera",
         "camera_view": "Bird's Eye View",
-        "cpuUsage": round(random.uniform(45, 65), 1),
-        "memoryUsage": round(random.uniform(40, 60), 1),
-        "gpuUsage": round(random.uniform(55, 75), 1),
+        "cpuUsage": _node_metrics[2][0],
+        "memoryUsage": _node_metrics[2][1],
+        "gpuUsage": _node_metrics[2][2],
         "networkStatus": "excellent",
-        "energyConsumption": round(random.uniform(85, 110), 1),
+        "energyConsumption": _node_metrics[2][3],
         "ip_address": "192.168.1.13",
         "port": 8083,
         "capabilities": {"detection": True, "yolo": "v8n", "classes": ["car", "van", "tricycle"]},
         "total_detections": 892,
         "average_latency": 35.7,
         "uptime": 99.2,
-        "last_heartbeat": datetime.now(timezone.utc).isoformat(),
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "last_heartbeat": NOW_ISO,
+        "created_at": NOW_ISO,
+        "updated_at": NOW_ISO,
         "live_feed": "/detections/complex_intersection.png"
     },
     {
@@ -169,20 +399,20 @@ MOCK_NODES = [
         "description": "Mixed-use area monitoring for pedestrian and vehicle traffic. Detects cars and people for crowd management and safety.",
         "camera_type": "4K Fixed Camera",
         "camera_view": "Street Level View",
-        "cpuUsage": round(random.uniform(50, 70), 1),
-        "memoryUsage": round(random.uniform(45, 65), 1),
-        "gpuUsage": round(random.uniform(60, 80), 1),
+        "cpuUsage": _node_metrics[3][0],
+        "memoryUsage": _node_metrics[3][1],
+        "gpuUsage": _node_metrics[3][2],
         "networkStatus": "good",
-        "energyConsumption": round(random.uniform(95, 120), 1),
+        "energyConsumption": _node_metrics[3][3],
         "ip_address": "192.168.1.14",
         "port": 8084,
         "capabilities": {"detection": True, "yolo": "v8n", "classes": ["car", "person"]},
         "total_detections": 1456,
         "average_latency": 44.2,
         "uptime": 97.8,
-        "last_heartbeat": datetime.now(timezone.utc).isoformat(),
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "last_heartbeat": NOW_ISO,
+        "created_at": NOW_ISO,
+        "updated_at": NOW_ISO,
         "live_feed": "/detections/pedestrian_area.png"
     },
     {
@@ -193,101 +423,228 @@ MOCK_NODES = [
         "description": "School zone safety monitoring. Real-time detection of vehicles and pedestrians during school hours for child safety.",
         "camera_type": "Smart Traffic Camera",
         "camera_view": "Crosswalk View",
-        "cpuUsage": round(random.uniform(55, 75), 1),
-        "memoryUsage": round(random.uniform(50, 70), 1),
-        "gpuUsage": round(random.uniform(65, 85), 1),
+        "cpuUsage": _node_metrics[4][0],
+        "memoryUsage": _node_metrics[4][1],
+        "gpuUsage": _node_metrics[4][2],
         "networkStatus": "excellent",
-        "energyConsumption": round(random.uniform(90, 115), 1),
+        "energyConsumption": _node_metrics[4][3],
         "ip_address": "192.168.1.15",
         "port": 8085,
         "capabilities": {"detection": True, "yolo": "v8n", "classes": ["car", "person", "bicycle"]},
         "total_detections": 1203,
         "average_latency": 39.8,
         "uptime": 99.5,
-        "last_heartbeat": datetime.now(timezone.utc).isoformat(),
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "last_heartbeat": NOW_ISO,
+        "created_at": NOW_ISO,
+        "updated_at": NOW_ISO,
         "live_feed": "/detections/mixed_traffic_aerial.png"
     }
 ]
 
 MOCK_DETECTIONS = [
     # Camera 1 - Downtown Intersection (Low Traffic)
-    {"id": 1, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=5)).isoformat(), "node_id": "edge-node-1", "stream_id": "stream-1", "object_type": "car", "confidence": 0.89, "bbox": {"x": 180, "y": 289, "width": 85, "height": 55}, "location": "Main Street & 5th Avenue", "image": "/detections/intersection_low_traffic.jpg"},
-    {"id": 2, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=5)).isoformat(), "node_id": "edge-node-1", "stream_id": "stream-1", "object_type": "car", "confidence": 0.92, "bbox": {"x": 98, "y": 318, "width": 78, "height": 48}, "location": "Main Street & 5th Avenue", "image": "/detections/intersection_low_traffic.jpg"},
-    {"id": 3, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=5)).isoformat(), "node_id": "edge-node-1", "stream_id": "stream-1", "object_type": "tricycle", "confidence": 0.76, "bbox": {"x": 42, "y": 315, "width": 45, "height": 35}, "location": "Main Street & 5th Avenue", "image": "/detections/intersection_low_traffic.jpg"},
-    {"id": 4, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=5)).isoformat(), "node_id": "edge-node-1", "stream_id": "stream-1", "object_type": "motorcycle", "confidence": 0.84, "bbox": {"x": 320, "y": 380, "width": 42, "height": 38}, "location": "Main Street & 5th Avenue", "image": "/detections/intersection_low_traffic.jpg"},
-    {"id": 5, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=5)).isoformat(), "node_id": "edge-node-1", "stream_id": "stream-1", "object_type": "motorcycle", "confidence": 0.78, "bbox": {"x": 145, "y": 380, "width": 40, "height": 36}, "location": "Main Street & 5th Avenue", "image": "/detections/intersection_low_traffic.jpg"},
+    {"id": 1, "timestamp": DETECTION_TS["edge-node-1"], "node_id": "edge-node-1", "stream_id": "stream-1", "object_type": "car", "confidence": 0.89, "bbox": {"x": 180, "y": 289, "width": 85, "height": 55}, "location": "Main Street & 5th Avenue", "image": "/detections/intersection_low_traffic.jpg"},
+    {"id": 2, "timestamp": DETECTION_TS["edge-node-1"], "node_id": "edge-node-1", "stream_id": "stream-1", "object_type": "car", "confidence": 0.92, "bbox": {"x": 98, "y": 318, "width": 78, "height": 48}, "location": "Main Street & 5th Avenue", "image": "/detections/intersection_low_traffic.jpg"},
+    {"id": 3, "timestamp": DETECTION_TS["edge-node-1"], "node_id": "edge-node-1", "stream_id": "stream-1", "object_type": "tricycle", "confidence": 0.76, "bbox": {"x": 42, "y": 315, "width": 45, "height": 35}, "location": "Main Street & 5th Avenue", "image": "/detections/intersection_low_traffic.jpg"},
+    {"id": 4, "timestamp": DETECTION_TS["edge-node-1"], "node_id": "edge-node-1", "stream_id": "stream-1", "object_type": "motorcycle", "confidence": 0.84, "bbox": {"x": 320, "y": 380, "width": 42, "height": 38}, "location": "Main Street & 5th Avenue", "image": "/detections/intersection_low_traffic.jpg"},
+    {"id": 5, "timestamp": DETECTION_TS["edge-node-1"], "node_id": "edge-node-1", "stream_id": "stream-1", "object_type": "motorcycle", "confidence": 0.78, "bbox": {"x": 145, "y": 380, "width": 40, "height": 36}, "location": "Main Street & 5th Avenue", "image": "/detections/intersection_low_traffic.jpg"},
     
     # Camera 2 - Highway Heavy Traffic (Dense Vehicle Detection)
-    {"id": 6, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=8)).isoformat(), "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "car", "confidence": 0.91, "bbox": {"x": 45, "y": 95, "width": 72, "height": 48}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
-    {"id": 7, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=8)).isoformat(), "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "car", "confidence": 0.88, "bbox": {"x": 125, "y": 115, "width": 75, "height": 52}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
-    {"id": 8, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=8)).isoformat(), "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "car", "confidence": 0.94, "bbox": {"x": 210, "y": 135, "width": 78, "height": 55}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
-    {"id": 9, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=8)).isoformat(), "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "car", "confidence": 0.92, "bbox": {"x": 295, "y": 155, "width": 82, "height": 58}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
-    {"id": 10, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=8)).isoformat(), "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "car", "confidence": 0.89, "bbox": {"x": 385, "y": 175, "width": 76, "height": 52}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
-    {"id": 11, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=8)).isoformat(), "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "car", "confidence": 0.93, "bbox": {"x": 475, "y": 195, "width": 80, "height": 55}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
-    {"id": 12, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=8)).isoformat(), "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "car", "confidence": 0.87, "bbox": {"x": 565, "y": 215, "width": 74, "height": 50}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
-    {"id": 13, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=8)).isoformat(), "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "pedestrian", "confidence": 0.82, "bbox": {"x": 630, "y": 175, "width": 25, "height": 58}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
+    {"id": 6, "timestamp": DETECTION_TS["edge-node-2"], "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "car", "confidence": 0.91, "bbox": {"x": 45, "y": 95, "width": 72, "height": 48}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
+    {"id": 7, "timestamp": DETECTION_TS["edge-node-2"], "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "car", "confidence": 0.88, "bbox": {"x": 125, "y": 115, "width": 75, "height": 52}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
+    {"id": 8, "timestamp": DETECTION_TS["edge-node-2"], "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "car", "confidence": 0.94, "bbox": {"x": 210, "y": 135, "width": 78, "height": 55}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
+    {"id": 9, "timestamp": DETECTION_TS["edge-node-2"], "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "car", "confidence": 0.92, "bbox": {"x": 295, "y": 155, "width": 82, "height": 58}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
+    {"id": 10, "timestamp": DETECTION_TS["edge-node-2"], "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "car", "confidence": 0.89, "bbox": {"x": 385, "y": 175, "width": 76, "height": 52}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
+    {"id": 11, "timestamp": DETECTION_TS["edge-node-2"], "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "car", "confidence": 0.93, "bbox": {"x": 475, "y": 195, "width": 80, "height": 55}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
+    {"id": 12, "timestamp": DETECTION_TS["edge-node-2"], "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "car", "confidence": 0.87, "bbox": {"x": 565, "y": 215, "width": 74, "height": 50}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
+    {"id": 13, "timestamp": DETECTION_TS["edge-node-2"], "node_id": "edge-node-2", "stream_id": "stream-2", "object_type": "pedestrian", "confidence": 0.82, "bbox": {"x": 630, "y": 175, "width": 25, "height": 58}, "location": "Highway 101 Mile Marker 45", "image": "/detections/highway_heavy_traffic.jpg"},
     
     # Camera 3 - Complex Intersection (Multi-lane Traffic)
-    {"id": 14, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=12)).isoformat(), "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "car", "confidence": 0.87, "bbox": {"x": 125, "y": 98, "width": 68, "height": 45}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
-    {"id": 15, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=12)).isoformat(), "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "car", "confidence": 0.92, "bbox": {"x": 205, "y": 115, "width": 75, "height": 52}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
-    {"id": 16, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=12)).isoformat(), "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "car", "confidence": 0.89, "bbox": {"x": 295, "y": 135, "width": 72, "height": 48}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
-    {"id": 17, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=12)).isoformat(), "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "car", "confidence": 0.85, "bbox": {"x": 385, "y": 155, "width": 70, "height": 46}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
-    {"id": 18, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=12)).isoformat(), "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "bus", "confidence": 0.94, "bbox": {"x": 165, "y": 195, "width": 95, "height": 65}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
-    {"id": 19, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=12)).isoformat(), "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "car", "confidence": 0.91, "bbox": {"x": 275, "y": 215, "width": 74, "height": 50}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
-    {"id": 20, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=12)).isoformat(), "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "car", "confidence": 0.88, "bbox": {"x": 365, "y": 235, "width": 68, "height": 44}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
-    {"id": 21, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=12)).isoformat(), "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "car", "confidence": 0.86, "bbox": {"x": 445, "y": 255, "width": 72, "height": 48}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
+    {"id": 14, "timestamp": DETECTION_TS["edge-node-3"], "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "car", "confidence": 0.87, "bbox": {"x": 125, "y": 98, "width": 68, "height": 45}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
+    {"id": 15, "timestamp": DETECTION_TS["edge-node-3"], "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "car", "confidence": 0.92, "bbox": {"x": 205, "y": 115, "width": 75, "height": 52}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
+    {"id": 16, "timestamp": DETECTION_TS["edge-node-3"], "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "car", "confidence": 0.89, "bbox": {"x": 295, "y": 135, "width": 72, "height": 48}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
+    {"id": 17, "timestamp": DETECTION_TS["edge-node-3"], "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "car", "confidence": 0.85, "bbox": {"x": 385, "y": 155, "width": 70, "height": 46}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
+    {"id": 18, "timestamp": DETECTION_TS["edge-node-3"], "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "bus", "confidence": 0.94, "bbox": {"x": 165, "y": 195, "width": 95, "height": 65}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
+    {"id": 19, "timestamp": DETECTION_TS["edge-node-3"], "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "car", "confidence": 0.91, "bbox": {"x": 275, "y": 215, "width": 74, "height": 50}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
+    {"id": 20, "timestamp": DETECTION_TS["edge-node-3"], "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "car", "confidence": 0.88, "bbox": {"x": 365, "y": 235, "width": 68, "height": 44}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
+    {"id": 21, "timestamp": DETECTION_TS["edge-node-3"], "node_id": "edge-node-3", "stream_id": "stream-3", "object_type": "car", "confidence": 0.86, "bbox": {"x": 445, "y": 255, "width": 72, "height": 48}, "location": "Complex Multi-lane Intersection", "image": "/detections/complex_intersection.jpg"},
     
     # Camera 4 - Pedestrian Area (People Detection Focus)
-    {"id": 22, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=15)).isoformat(), "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.94, "bbox": {"x": 85, "y": 125, "width": 28, "height": 65}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
-    {"id": 23, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=15)).isoformat(), "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.91, "bbox": {"x": 145, "y": 135, "width": 25, "height": 62}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
-    {"id": 24, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=15)).isoformat(), "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.88, "bbox": {"x": 195, "y": 145, "width": 30, "height": 68}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
-    {"id": 25, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=15)).isoformat(), "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.92, "bbox": {"x": 255, "y": 155, "width": 26, "height": 64}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
-    {"id": 26, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=15)).isoformat(), "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.89, "bbox": {"x": 315, "y": 165, "width": 28, "height": 66}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
-    {"id": 27, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=15)).isoformat(), "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.95, "bbox": {"x": 375, "y": 175, "width": 32, "height": 70}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
-    {"id": 28, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=15)).isoformat(), "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.86, "bbox": {"x": 125, "y": 225, "width": 29, "height": 67}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
-    {"id": 29, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=15)).isoformat(), "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.93, "bbox": {"x": 185, "y": 235, "width": 27, "height": 65}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
-    {"id": 30, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=15)).isoformat(), "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.87, "bbox": {"x": 245, "y": 245, "width": 31, "height": 68}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
+    {"id": 22, "timestamp": DETECTION_TS["edge-node-4"], "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.94, "bbox": {"x": 85, "y": 125, "width": 28, "height": 65}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
+    {"id": 23, "timestamp": DETECTION_TS["edge-node-4"], "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.91, "bbox": {"x": 145, "y": 135, "width": 25, "height": 62}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
+    {"id": 24, "timestamp": DETECTION_TS["edge-node-4"], "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.88, "bbox": {"x": 195, "y": 145, "width": 30, "height": 68}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
+    {"id": 25, "timestamp": DETECTION_TS["edge-node-4"], "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.92, "bbox": {"x": 255, "y": 155, "width": 26, "height": 64}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
+    {"id": 26, "timestamp": DETECTION_TS["edge-node-4"], "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.89, "bbox": {"x": 315, "y": 165, "width": 28, "height": 66}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
+    {"id": 27, "timestamp": DETECTION_TS["edge-node-4"], "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.95, "bbox": {"x": 375, "y": 175, "width": 32, "height": 70}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
+    {"id": 28, "timestamp": DETECTION_TS["edge-node-4"], "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.86, "bbox": {"x": 125, "y": 225, "width": 29, "height": 67}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
+    {"id": 29, "timestamp": DETECTION_TS["edge-node-4"], "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.93, "bbox": {"x": 185, "y": 235, "width": 27, "height": 65}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
+    {"id": 30, "timestamp": DETECTION_TS["edge-node-4"], "node_id": "edge-node-4", "stream_id": "stream-4", "object_type": "pedestrian", "confidence": 0.87, "bbox": {"x": 245, "y": 245, "width": 31, "height": 68}, "location": "City Plaza Commercial District", "image": "/detections/pedestrian_area.jpg"},
     
     # Camera 5 - Mixed Traffic Aerial View
-    {"id": 31, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=20)).isoformat(), "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "car", "confidence": 0.89, "bbox": {"x": 95, "y": 145, "width": 58, "height": 35}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
-    {"id": 32, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=20)).isoformat(), "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "car", "confidence": 0.91, "bbox": {"x": 165, "y": 165, "width": 62, "height": 38}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
-    {"id": 33, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=20)).isoformat(), "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "bus", "confidence": 0.96, "bbox": {"x": 245, "y": 135, "width": 85, "height": 52}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
-    {"id": 34, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=20)).isoformat(), "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "car", "confidence": 0.88, "bbox": {"x": 345, "y": 155, "width": 60, "height": 36}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
-    {"id": 35, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=20)).isoformat(), "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "motorcycle", "confidence": 0.82, "bbox": {"x": 425, "y": 175, "width": 32, "height": 28}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
-    {"id": 36, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=20)).isoformat(), "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "car", "confidence": 0.93, "bbox": {"x": 485, "y": 185, "width": 64, "height": 38}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
-    {"id": 37, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=20)).isoformat(), "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "van", "confidence": 0.87, "bbox": {"x": 125, "y": 225, "width": 68, "height": 45}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
-    {"id": 38, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=20)).isoformat(), "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "car", "confidence": 0.90, "bbox": {"x": 215, "y": 245, "width": 61, "height": 37}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
-    {"id": 39, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=20)).isoformat(), "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "truck", "confidence": 0.94, "bbox": {"x": 295, "y": 235, "width": 78, "height": 48}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
-    {"id": 40, "timestamp": (datetime.now(timezone.utc) - timedelta(seconds=20)).isoformat(), "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "car", "confidence": 0.86, "bbox": {"x": 385, "y": 255, "width": 59, "height": 35}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
+    {"id": 31, "timestamp": DETECTION_TS["edge-node-5"], "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "car", "confidence": 0.89, "bbox": {"x": 95, "y": 145, "width": 58, "height": 35}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
+    {"id": 32, "timestamp": DETECTION_TS["edge-node-5"], "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "car", "confidence": 0.91, "bbox": {"x": 165, "y": 165, "width": 62, "height": 38}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
+    {"id": 33, "timestamp": DETECTION_TS["edge-node-5"], "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "bus", "confidence": 0.96, "bbox": {"x": 245, "y": 135, "width": 85, "height": 52}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
+    {"id": 34, "timestamp": DETECTION_TS["edge-node-5"], "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "car", "confidence": 0.88, "bbox": {"x": 345, "y": 155, "width": 60, "height": 36}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
+    {"id": 35, "timestamp": DETECTION_TS["edge-node-5"], "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "motorcycle", "confidence": 0.82, "bbox": {"x": 425, "y": 175, "width": 32, "height": 28}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
+    {"id": 36, "timestamp": DETECTION_TS["edge-node-5"], "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "car", "confidence": 0.93, "bbox": {"x": 485, "y": 185, "width": 64, "height": 38}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
+    {"id": 37, "timestamp": DETECTION_TS["edge-node-5"], "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "van", "confidence": 0.87, "bbox": {"x": 125, "y": 225, "width": 68, "height": 45}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
+    {"id": 38, "timestamp": DETECTION_TS["edge-node-5"], "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "car", "confidence": 0.90, "bbox": {"x": 215, "y": 245, "width": 61, "height": 37}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
+    {"id": 39, "timestamp": DETECTION_TS["edge-node-5"], "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "truck", "confidence": 0.94, "bbox": {"x": 295, "y": 235, "width": 78, "height": 48}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
+    {"id": 40, "timestamp": DETECTION_TS["edge-node-5"], "node_id": "edge-node-5", "stream_id": "stream-5", "object_type": "car", "confidence": 0.86, "bbox": {"x": 385, "y": 255, "width": 59, "height": 35}, "location": "Innovation District", "image": "/detections/mixed_traffic_aerial.jpg"},
 ]
 
+_LOG_LEVELS = np.array(["info", "warning", "error"])
+_LOG_SOURCES = np.array(["api", "detection", "system", "network"])
+_LOG_MESSAGES = np.array([
+    "System started successfully",
+    "Node heartbeat received",
+    "Detection processed",
+    "High CPU usage detected",
+    "Network latency increased"
+])
+
 MOCK_LOGS = [
     {
         "id": i,
-        "timestamp": (datetime.now(timezone.utc) - timedelta(minutes=i*3)).isoformat(),
-        "level": random.choice(["info", "warning", "error"]),
-        "source": random.choice(["api", "detection", "system", "network"]),
-        "message": random.choice([
-            "System started successfully",
-            "Node heartbeat received",
-            "Detection processed",
-            "High CPU usage detected",
-            "Network latency increased"
-        ])
+        "timestamp": timestamp,
+        "level": level,
+        "source": source,
+        "message": message
     }
-    for i in range(1, 31)
+    for i, timestamp, level, source, message in zip(
+        range(1, 31),
+        MOCK_LOG_TS,
+        _LOG_LEVELS[_rng.integers(0, len(_LOG_LEVELS), 30)].tolist(),
+        _LOG_SOURCES[_rng.integers(0, len(_LOG_SOURCES), 30)].tolist(),
+        _LOG_MESSAGES[_rng.integers(0, len(_LOG_MESSAGES), 30)].tolist()
+    )
 ]
 
+
+
+def _freeze(obj):
+    """Read-only deep copy: dicts become MappingProxyType, lists become tuples"""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+# Mock data is shared by every request, so it is frozen: handlers can hand out
+# references (and the pre-serialized blobs below stay valid) without copying
+MOCK_NODES = _freeze(MOCK_NODES)
+MOCK_DETECTIONS = _freeze(MOCK_DETECTIONS)
+MOCK_LOGS = _freeze(MOCK_LOGS)
+
+# O(1) lookups by node id, built once
+NODES_BY_ID = MappingProxyType({n["id"]: n for n in MOCK_NODES})
+NODES_BY_STATUS = MappingProxyType({
+    status: tuple(n for n in MOCK_NODES if n["status"] == status)
+    for status in {n["status"] for n in MOCK_NODES}
+})
+_detections_by_node = defaultdict(list)
+for _det in MOCK_DETECTIONS:
+    _detections_by_node[_det["node_id"]].append(_det)
+DETECTIONS_BY_NODE = MappingProxyType({k: tuple(v) for k, v in _detections_by_node.items()})
+
+# Column (SoA) view of MOCK_DETECTIONS for vectorized filtering; node ids and
+# object types are stored as indexes into small string tables
+DET_NODE_IDS = tuple(n["id"] for n in MOCK_NODES)
+DET_OBJECT_TYPES = tuple(sorted({d["object_type"] for d in MOCK_DETECTIONS}))
+det_node_idx = np.array([DET_NODE_IDS.index(d["node_id"]) for d in MOCK_DETECTIONS], dtype=np.int8)
+det_type_idx = np.array([DET_OBJECT_TYPES.index(d["object_type"]) for d in MOCK_DETECTIONS], dtype=np.int8)
+det_conf = np.array([d["confidence"] for d in MOCK_DETECTIONS], dtype=np.float32)
+
+# Static list payloads, serialized once and served as raw JSON bytes
+NODES_JSON = _json_bytes(MOCK_NODES)
+DETECTIONS_JSON = _json_bytes(MOCK_DETECTIONS)
+DETECTION_SUMMARY_JSON = _json_bytes({
+    "total": len(MOCK_DETECTIONS),
+    "time_range": "24h",
+    "average_confidence": 0.92,
+    "by_type": {"car": 20, "person": 15, "bicycle": 10, "motorcycle": 3, "bus": 2}
+})
+MOCK_NODES_SUMMARY_JSON = _json_bytes({
+    'total': 5,
+    'active': 4,
+    'idle': 1,
+    'fault': 0,
+    'total_detections': 1234,
+    'average_cpu': 62.5,
+    'average_memory': 58.3,
+    'total_energy': 456.7
+})
+
+# Encoded unfiltered list prefixes, keyed by the effective limit (clamped to
+# the list length, so at most one entry per possible slice)
+MAX_LIST_LIMIT = 1000
+_detections_by_limit = {len(MOCK_DETECTIONS): DETECTIONS_JSON}
+_logs_by_limit = {}
+
+
+def _sliced_json(cache: dict, rows, limit: int) -> Response:
+    """rows[:limit] as JSON, encoded once per distinct slice"""
+    n = min(limit, len(rows))
+    body = cache.get(n)
+    if body is None:
+        body = cache[n] = _json_bytes(rows[:n])
+    return Response(body, media_type="application/json")
+
+
+# Polled payloads carry an ETag so unchanged polls get an empty 304
+POLL_MAX_AGE = 5  # seconds, for Cache-Control
+
+
+def _etag(body: bytes) -> str:
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _conditional_json(request: Optional[Request], body: bytes, etag: str) -> Response:
+    """body as JSON, or 304 if the client already holds this ETag"""
+    headers = {"ETag": etag, "Cache-Control": f"max-age={POLL_MAX_AGE}"}
+    if request is not None and request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+DETECTION_SUMMARY_ETAG = _etag(DETECTION_SUMMARY_JSON)
+CONSENSUS_SUMMARY_JSON = _json_bytes({
+    "total_rounds": 10,
+    "successful_rounds": 7,
+    "success_rate": 70.0,
+    "average_duration_ms": 125.0,
+    "average_participants": 4.0
+})
+CONSENSUS_SUMMARY_ETAG = _etag(CONSENSUS_SUMMARY_JSON)
+
+# Randomized mock payloads are rebuilt at most once per MOCK_PAYLOAD_TTL seconds
+MOCK_PAYLOAD_TTL = 5.0
+_json_cache = {}  # key -> (expires_at, encoded body, etag)
+
+
+def _cached_json(key: str, ttl: float, build, request: Optional[Request] = None) -> Response:
+    """Serve build() as JSON, reusing the encoded body until ttl expires"""
+    now = time.monotonic()
+    entry = _json_cache.get(key)
+    if entry is None or now >= entry[0]:
+        body = _json_bytes(build())
+        entry = (now + ttl, body, _etag(body))
+        _json_cache[key] = entry
+    return _conditional_json(request, entry[1], entry[2])
+
 # Startup function
 
 async def startup_event():
     """Initialize services on startup"""
-    global detection_service, system_monitor, anomaly_transmitter
+    global detection_service, system_monitor, anomaly_transmitter, emit_queue
+    global _ds_has_frame_count
     
     logger.info("🚀 Starting EDGE-QI Backend Server...")
     
+    emit_queue = asyncio.Queue(maxsize=EMIT_QUEUE_SIZE)
+    asyncio.create_task(emit_worker())
+    
     if SERVICES_AVAILABLE:
         try:
             # Initialize system monitor
@@ -301,12 +658,17 @@ async def startup_event():
             )
             logger.info("✅ Anomaly Transmitter initialized")
             
-            # Initialize detection service (will try to load YOLO)
-            detection_service = YOLODetectionService(
+            # Initialize detection service (will try to load YOLO). Model
+            # load, warmup and any export are blocking, so they run off the
+            # event loop
+            detection_service = await asyncio.to_thread(
+                YOLODetectionService,
                 model_path="yolov8n.pt",  # Will download if not present
                 device="auto",
-                conf_threshold=0.25
+                conf_threshold=0.25,
+                backend=YOLO_BACKEND
             )
+            _ds_has_frame_count = hasattr(detection_service, 'frame_count')
             logger.info("✅ Detection Service initialized")
             
             # Start background tasks
@@ -323,15 +685,137 @@ async def startup_event():
     logger.info("✅ Server startup complete")
 
 
+def post_event(event: str, data: dict, sections: Optional[dict] = None):
+    """
+    Queue an event for broadcast, dropping the oldest one if the queue is full.
+    sections (encoded system_metrics sections) are recorded as sent only once
+    the emit carrying them has gone out, so a dropped delta is re-sent later.
+    """
+    if emit_queue is None or not connected_clients:
+        return
+    try:
+        emit_queue.put_nowait((event, data, sections))
+    except asyncio.QueueFull:
+        emit_queue.get_nowait()
+        emit_queue.put_nowait((event, data, sections))
+
+
+async def _emit(event: str, data, sections: Optional[dict]):
+    try:
+        await sio.emit(event, data)
+    except Exception as e:
+        logger.error(f"Emit error ({event}): {e}")
+        return
+    if sections:
+        _last_metric_sections.update(sections)
+
+
+async def emit_worker():
+    """
+    Drain queued events to Socket.IO clients. Events are sent as soon as they
+    are dequeued, except EMIT_MERGE_EVENTS: the first one opens a window of
+    EMIT_BATCH_WINDOW in which later ones are merged into it (later keys
+    win) before a single emit under the same name.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        event, data, sections = await emit_queue.get()
+        if event not in EMIT_MERGE_EVENTS:
+            await _emit(event, data, sections)
+            continue
+        
+        merged = {event: (dict(data), dict(sections or {}))}
+        deadline = loop.time() + EMIT_BATCH_WINDOW
+        for _ in range(EMIT_BATCH_MAX - 1):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                event, data, sections = await asyncio.wait_for(emit_queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if event not in EMIT_MERGE_EVENTS:
+                await _emit(event, data, sections)
+                continue
+            if event not in merged:
+                merged[event] = ({}, {})
+            merged[event][0].update(data)
+            merged[event][1].update(sections or {})
+        for event, (data, sections) in merged.items():
+            await _emit(event, data, sections)
+
+
+# Shared system_monitor snapshot: the periodic broadcast and dashboard polls
+# within METRICS_CACHE_TTL of each other reuse one psutil walk
+METRICS_CACHE_TTL = 0.25
+_metrics_cache = {"ts": 0.0, "val": None}
+_metrics_lock = asyncio.Lock()
+
+
+async def cached_metrics() -> dict:
+    """system_monitor.get_all_metrics(), refreshed at most every METRICS_CACHE_TTL"""
+    async with _metrics_lock:
+        now = time.monotonic()
+        if _metrics_cache["val"] is None or now - _metrics_cache["ts"] > METRICS_CACHE_TTL:
+            _metrics_cache["val"] = await asyncio.to_thread(system_monitor.get_all_metrics)
+            _metrics_cache["ts"] = time.monotonic()
+        return _metrics_cache["val"]
+
+
+# The anomaly report changes every frame while the stream runs; polls from
+# several dashboard tabs within REPORT_CACHE_TTL share one rendering
+REPORT_CACHE_TTL = 2.0
+_report_cache = {"ts": 0.0, "val": None}
+_report_lock = asyncio.Lock()
+
+
+async def cached_report() -> str:
+    """anomaly_transmitter.get_efficiency_report(), refreshed at most every REPORT_CACHE_TTL"""
+    async with _report_lock:
+        now = time.monotonic()
+        if _report_cache["val"] is None or now - _report_cache["ts"] > REPORT_CACHE_TTL:
+            _report_cache["val"] = await asyncio.to_thread(anomaly_transmitter.get_efficiency_report)
+            _report_cache["ts"] = time.monotonic()
+        return _report_cache["val"]
+
+
+# Encoded form of each system_metrics section as last broadcast; cleared when a
+# client connects so it receives a full snapshot on the next tick
+_last_metric_sections = {}
+# Keys that change every tick: sent along with a delta, never trigger one
+_VOLATILE_METRIC_KEYS = ('timestamp', 'uptime_seconds')
+
+
+def _metrics_delta(metrics: dict):
+    """
+    Sections of metrics whose encoded value differs from the last broadcast,
+    plus their encodings for emit_worker to record once they are sent
+    """
+    delta = {}
+    encoded_sections = {}
+    for name, section in metrics.items():
+        if name in _VOLATILE_METRIC_KEYS:
+            continue
+        encoded = _json_bytes(section)
+        if _last_metric_sections.get(name) != encoded:
+            encoded_sections[name] = encoded
+            delta[name] = section
+    if delta:
+        for name in _VOLATILE_METRIC_KEYS:
+            if name in metrics:
+                delta[name] = metrics[name]
+    return delta, encoded_sections
+
+
 async def broadcast_system_metrics():
     """Periodically broadcast real system metrics"""
     await asyncio.sleep(2)  # Wait for clients to connect
     
     while True:
         try:
-            if system_monitor:
+            if system_monitor and connected_clients:
                 # Get real metrics
-                metrics = system_monitor.get_all_metrics()
+                metrics = dict(await cached_metrics())
                 
                 # Add detection stats if available
                 if detection_service:
@@ -341,8 +825,10 @@ async def broadcast_system_metrics():
                 if anomaly_transmitter:
                     metrics['anomaly'] = anomaly_transmitter.get_stats()
                 
-                # Broadcast to all clients
-                await sio.emit('system_metrics', metrics)
+                # Broadcast only the sections that changed since the last tick
+                delta, encoded_sections = _metrics_delta(metrics)
+                if delta:
+                    post_event('system_metrics', delta, encoded_sections)
             
         except Exception as e:
             logger.error(f"Metrics broadcast error: {e}")
@@ -350,6 +836,16 @@ async def broadcast_system_metrics():
         await asyncio.sleep(2)  # Update every 2 seconds
 
 
+# Synthetic detection ranges: bbox [x, y, w, h] (exclusive highs) and classes
+_SIM_BBOX_LOW = np.array([50, 50, 80, 60])
+_SIM_BBOX_HIGH = np.array([501, 401, 151, 121])
+_SIM_CLASS_NAMES = np.array(['car', 'bus', 'truck', 'van', 'person'])
+
+# Key order of the 'new_detections' payload
+_DETECT_EVT_KEYS = ('frame_count', 'vehicle_count', 'detections', 'reason',
+                    'z_score', 'bandwidth_saved', 'timestamp', 'mode')
+
+
 async def simulate_detection_stream():
     """
     Demo mode: Simulate realistic traffic detection without camera
@@ -360,40 +856,44 @@ async def simulate_detection_stream():
     logger.info("🎬 Starting detection simulation (Demo mode - No camera needed)")
     
     frame_count = 0
+    frame_interval = 0.2  # 5 FPS
+    loop = asyncio.get_running_loop()
+    next_frame_at = loop.time()
     
     while True:
         try:
             if not anomaly_transmitter or not detection_service:
                 await asyncio.sleep(1)
+                next_frame_at = loop.time()
                 continue
-            
             # Simulate realistic traffic patterns
             # Create variable traffic to trigger anomalies
             if frame_count % 100 < 30:
                 # Low traffic period (0-30 frames)
-                vehicle_count = random.randint(3, 8)
+                vehicle_count = int(_rng.integers(3, 9))
             elif frame_count % 100 < 70:
                 # Normal traffic (30-70 frames)
-                vehicle_count = random.randint(8, 15)
+                vehicle_count = int(_rng.integers(8, 16))
             else:
                 # Rush hour / anomaly (70-100 frames)
-                vehicle_count = random.randint(20, 40)
+                vehicle_count = int(_rng.integers(20, 41))
             
-            # Generate synthetic detections
-            detections = []
-            for i in range(vehicle_count):
-                detection = {
-                    'bbox': [
-                        random.randint(50, 500),
-                        random.randint(50, 400),
-                        random.randint(80, 150),
-                        random.randint(60, 120)
-                    ],
-                    'confidence': round(random.uniform(0.7, 0.99), 2),
-                    'class_id': random.choice([0, 1, 2, 3, 4]),  # car, bus, truck, van, person
-                    'class_name': random.choice(['car', 'bus', 'truck', 'van', 'person'])
+            # Generate synthetic detections (one vectorized draw per field)
+            bboxes = _rng.integers(_SIM_BBOX_LOW, _SIM_BBOX_HIGH, size=(vehicle_count, 4)).tolist()
+            confidences = _rng.uniform(0.7, 0.99, vehicle_count).round(2).tolist()
+            class_ids = _rng.integers(0, len(_SIM_CLASS_NAMES), vehicle_count)
+            class_names = _SIM_CLASS_NAMES[class_ids].tolist()
+            detections = [
+                {
+                    'bbox': bbox,
+                    'confidence': confidence,
+                    'class_id': class_id,
+                    'class_name': class_name
                 }
-                detections.append(detection)
+                for bbox, confidence, class_id, class_name in zip(
+                    bboxes, confidences, class_ids.tolist(), class_names
+                )
+            ]
             
             # Use anomaly transmitter to decide if we should transmit
             should_transmit, reason, metadata = anomaly_transmitter.should_transmit(detections)
@@ -401,30 +901,39 @@ async def simulate_detection_stream():
             frame_count += 1
             
             # Simulate frame processing for detection stats
-            if hasattr(detection_service, 'frame_count'):
+            if _ds_has_frame_count:
                 detection_service.frame_count = frame_count
                 detection_service.total_detections = frame_count * 12  # Average
             
-            # Broadcast detection event if anomaly detected
+            # Broadcast detection event if anomaly detected. The stats above
+            # keep updating with no socket clients (REST pollers read them);
+            # post_event itself skips the emit when nobody is connected.
             if should_transmit:
-                await sio.emit('new_detections', {
-                    'frame_count': frame_count,
-                    'vehicle_count': vehicle_count,
-                    'detections': len(detections),
-                    'reason': reason,
-                    'z_score': metadata.get('z_score', 0),
-                    'bandwidth_saved': metadata.get('bandwidth_saved_pct', 0),
-                    'timestamp': datetime.now(timezone.utc).isoformat(),
-                    'mode': 'DEMO_SIMULATION'
-                })
+                post_event('new_detections', dict(zip(_DETECT_EVT_KEYS, (
+                    frame_count,
+                    vehicle_count,
+                    len(detections),
+                    reason,
+                    metadata.get('z_score', 0),
+                    metadata.get('bandwidth_saved_pct', 0),
+                    _iso_now(),
+                    'DEMO_SIMULATION'
+                ))))
                 logger.info(f"🚗 Frame {frame_count}: {vehicle_count} vehicles (Transmitted - {reason})")
             
-            # Slow down simulation to realistic rate (5 FPS = 200ms per frame)
-            await asyncio.sleep(0.2)
+            # Hold a realistic rate (5 FPS = 200ms per frame) against a fixed
+            # schedule, so processing/emit time doesn't accumulate as drift
+            next_frame_at += frame_interval
+            delay = next_frame_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                next_frame_at = loop.time()  # Fell behind: resync, don't burst
             
         except Exception as e:
             logger.error(f"Simulation error: {e}")
             await asyncio.sleep(1)
+            next_frame_at = loop.time()
 
 
 # API Endpoints
@@ -444,7 +953,7 @@ async def health():
     """Health check with service status"""
     status = {
         "status": "healthy",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _iso_now(),
         "services": {
             "detection": detection_service is not None,
             "monitor": system_monitor is not None,
@@ -467,9 +976,13 @@ async def system_status():
     
     if system_monitor and anomaly_transmitter and detection_service:
         # REAL DATA MODE
-        sys_metrics = system_monitor.get_all_metrics()
-        detection_stats = detection_service.get_stats()
-        anomaly_stats = anomaly_transmitter.get_stats()
+        # Collected concurrently off the event loop: psutil's CPU sampling
+        # alone blocks for ~0.2s
+        sys_metrics, detection_stats, anomaly_stats = await asyncio.gather(
+            cached_metrics(),
+            asyncio.to_thread(detection_service.get_stats),
+            asyncio.to_thread(anomaly_transmitter.get_stats)
+        )
         
         metrics = {
             'total_nodes': 5,
@@ -483,7 +996,7 @@ async def system_status():
             'average_memory': sys_metrics['memory']['percent'],
             'bandwidth_saved': anomaly_stats.get('bandwidth_saved_percent', 74.5),
             'energy_saved': 12.3,  # TODO: Calculate from actual power monitoring
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': _iso_now(),
             'mode': 'REAL_DATA'
         }
     else:
@@ -500,58 +1013,58 @@ async def system_status():
             'average_memory': 58.3,
             'bandwidth_saved': 74.5,
             'energy_saved': 12.3,
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': _iso_now(),
             'mode': 'MOCK_DATA'
         }
     
-    # Broadcast to websocket
-    await sio.emit('system_metrics', metrics)
+    # Broadcast to websocket (queued: the response doesn't wait on client
+    # sends). Sent as a delta like the periodic broadcast, so clients only
+    # ever see changed fields on system_metrics.
+    delta, encoded_sections = _metrics_delta(metrics)
+    if delta:
+        post_event('system_metrics', delta, encoded_sections)
     return metrics
 
+# Static parts of the /api/system/health body; only the timestamp is spliced in
+_HEALTH_PREFIX = b'{"status":"healthy","version":"1.0.0","timestamp":"'
+_HEALTH_SUFFIX = b'","database":"not_connected","mqtt":"unknown","redis":"unknown"}'
+
 @app.get("/api/system/health")
 async def system_health():
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "database": "not_connected",
-        "mqtt": "unknown",
-        "redis": "unknown"
-    }
+    return Response(_HEALTH_PREFIX + _iso_now().encode() + _HEALTH_SUFFIX,
+                    media_type="application/json")
 
 @app.get("/api/system/nodes/summary")
 async def nodes_summary():
     """Node summary with real metrics"""
     if system_monitor:
-        sys_metrics = system_monitor.get_all_metrics()
+        if detection_service:
+            sys_metrics, detection_stats = await asyncio.gather(
+                cached_metrics(),
+                asyncio.to_thread(detection_service.get_stats)
+            )
+        else:
+            sys_metrics = await cached_metrics()
+            detection_stats = {}
         return {
             'total': 5,
             'active': 4,
             'idle': 1,
             'fault': 0,
-            'total_detections': detection_service.get_stats().get('total_detections', 0) if detection_service else 0,
+            'total_detections': detection_stats.get('total_detections', 0),
             'average_cpu': sys_metrics['cpu']['usage_percent'],
             'average_memory': sys_metrics['memory']['percent'],
             'total_energy': 456.7  # TODO: Implement real power monitoring
         }
     else:
-        return {
-            'total': 5,
-            'active': 4,
-            'idle': 1,
-            'fault': 0,
-            'total_detections': 1234,
-            'average_cpu': 62.5,
-            'average_memory': 58.3,
-            'total_energy': 456.7
-        }
+        return Response(MOCK_NODES_SUMMARY_JSON, media_type="application/json")
 
 # NEW: Real system metrics endpoints
 @app.get("/api/system/metrics/real")
 async def get_real_metrics():
     """Get actual system metrics (CPU, memory, GPU, battery, network)"""
     if system_monitor:
-        return system_monitor.get_all_metrics()
+        return await cached_metrics()
     else:
         return {"error": "System monitor not available", "mode": "mock"}
 
@@ -576,68 +1089,120 @@ async def get_anomaly_report():
     """Get detailed anomaly efficiency report"""
     if anomaly_transmitter:
         return {
-            "report": anomaly_transmitter.get_efficiency_report(),
+            "report": await cached_report(),
             "stats": anomaly_transmitter.get_stats()
         }
     else:
         return {"error": "Anomaly transmitter not available"}
 
+async def _unavailable(name: str) -> dict:
+    return {"error": f"{name} not available", "mode": "mock"}
+
+@app.get("/api/stats/all")
+async def get_all_stats():
+    """
+    Detection, anomaly (stats + report) and system metrics in one response,
+    collected concurrently. Preferred over polling the four endpoints
+    separately; those remain for compatibility.
+    """
+    detection, anomaly, report, system = await asyncio.gather(
+        asyncio.to_thread(detection_service.get_stats) if detection_service
+        else _unavailable("Detection service"),
+        asyncio.to_thread(anomaly_transmitter.get_stats) if anomaly_transmitter
+        else _unavailable("Anomaly transmitter"),
+        cached_report() if anomaly_transmitter
+        else _unavailable("Anomaly transmitter"),
+        cached_metrics() if system_monitor else _unavailable("System monitor")
+    )
+    return {"detection": detection, "anomaly": anomaly, "report": report, "system": system}
+
 # Node Endpoints
 @app.get("/api/nodes")
 async def list_nodes(status: Optional[str] = Query(None)):
     if status:
-        return [n for n in MOCK_NODES if n["status"] == status]
-    return MOCK_NODES
+        return NODES_BY_STATUS.get(status, ())
+    return Response(NODES_JSON, media_type="application/json")
 
 @app.get("/api/nodes/{node_id}")
 async def get_node(node_id: str):
-    for node in MOCK_NODES:
-        if node["id"] == node_id:
-            return node
-    return {"error": "Node not found"}
+    return NODES_BY_ID.get(node_id, {"error": "Node not found"})
 
 # Detection Endpoints
 @app.get("/api/detections")
-async def list_detections(limit: int = Query(100)):
-    return MOCK_DETECTIONS[:limit]
+async def list_detections(
+    limit: int = Query(100, ge=1, le=MAX_LIST_LIMIT),
+    node_id: Optional[str] = Query(None),
+    object_type: Optional[str] = Query(None),
+    min_confidence: Optional[float] = Query(None)
+):
+    if node_id is None and object_type is None and min_confidence is None:
+        return _sliced_json(_detections_by_limit, MOCK_DETECTIONS, limit)
+    if object_type is None and min_confidence is None:
+        return DETECTIONS_BY_NODE.get(node_id, ())[:limit]
+    
+    # Vectorized mask over the column arrays; dicts only for the matching rows
+    if node_id is not None and node_id not in DET_NODE_IDS:
+        return []
+    if object_type is not None and object_type not in DET_OBJECT_TYPES:
+        return []
+    mask = np.ones(len(MOCK_DETECTIONS), dtype=bool)
+    if node_id is not None:
+        mask &= det_node_idx == DET_NODE_IDS.index(node_id)
+    if object_type is not None:
+        mask &= det_type_idx == DET_OBJECT_TYPES.index(object_type)
+    if min_confidence is not None:
+        mask &= det_conf >= min_confidence
+    return [MOCK_DETECTIONS[i] for i in np.flatnonzero(mask)[:limit].tolist()]
 
 @app.get("/api/detections/stats/summary")
-async def detection_summary():
-    return {
-        "total": len(MOCK_DETECTIONS),
-        "time_range": "24h",
-        "average_confidence": 0.92,
-        "by_type": {"car": 20, "person": 15, "bicycle": 10, "motorcycle": 3, "bus": 2}
-    }
+async def detection_summary(request: Request):
+    return _conditional_json(request, DETECTION_SUMMARY_JSON, DETECTION_SUMMARY_ETAG)
 
 # Analytics Endpoints
-@app.get("/api/analytics/data")
-async def analytics_data():
+_HOURS = [f"{h}:00" for h in range(24)]
+_ANALYTICS_OBJECTS = ["car", "person", "bicycle", "motorcycle", "bus"]
+_ANALYTICS_NODES = [f"Node {i}" for i in range(1, 6)]
+
+
+def _build_analytics_data():
+    # One vectorized draw per series instead of a random.* call per point
+    traffic = _rng.integers(10, 51, 24).tolist()
+    latency = _rng.uniform(20, 80, 24).round(1).tolist()
+    distribution = _rng.integers(5, 31, len(_ANALYTICS_OBJECTS)).tolist()
+    bandwidth = _rng.uniform(50, 200, 24).round(1).tolist()
+    energy = _rng.uniform(1, 10, 24).round(1).tolist()
+    activity = _rng.integers(50, 301, len(_ANALYTICS_NODES)).tolist()
     return {
-        "traffic_trends": [{"time": f"{h}:00", "detections": random.randint(10, 50)} for h in range(24)],
-        "performance_metrics": [{"time": f"{h}:00", "latency": round(random.uniform(20, 80), 1)} for h in range(24)],
-        "detection_distribution": [{"name": obj, "value": random.randint(5, 30)} for obj in ["car", "person", "bicycle", "motorcycle", "bus"]],
-        "bandwidth_comparison": [{"time": f"{h}:00", "saved": round(random.uniform(50, 200), 1)} for h in range(24)],
-        "energy_efficiency": [{"time": f"{h}:00", "saved": round(random.uniform(1, 10), 1)} for h in range(24)],
-        "node_activity": [{"node": f"Node {i}", "detections": random.randint(50, 300)} for i in range(1, 6)]
+        "traffic_trends": [{"time": t, "detections": d} for t, d in zip(_HOURS, traffic)],
+        "performance_metrics": [{"time": t, "latency": v} for t, v in zip(_HOURS, latency)],
+        "detection_distribution": [{"name": obj, "value": v} for obj, v in zip(_ANALYTICS_OBJECTS, distribution)],
+        "bandwidth_comparison": [{"time": t, "saved": v} for t, v in zip(_HOURS, bandwidth)],
+        "energy_efficiency": [{"time": t, "saved": v} for t, v in zip(_HOURS, energy)],
+        "node_activity": [{"node": n, "detections": d} for n, d in zip(_ANALYTICS_NODES, activity)]
     }
 
+@app.get("/api/analytics/data")
+async def analytics_data(request: Request):
+    return _cached_json("analytics_data", MOCK_PAYLOAD_TTL, _build_analytics_data, request)
+
 # Logs Endpoints
 @app.get("/api/logs")
-async def list_logs(limit: int = Query(100)):
-    return MOCK_LOGS[:limit]
+async def list_logs(limit: int = Query(100, ge=1, le=MAX_LIST_LIMIT)):
+    return _sliced_json(_logs_by_limit, MOCK_LOGS, limit)
 
 # Consensus Endpoints
-@app.get("/api/consensus/rounds")
-async def list_consensus_rounds():
+def _build_consensus_rounds():
+    now = datetime.now(timezone.utc)
+    participants = _rng.integers(3, 6, 10).tolist()
+    durations = _rng.integers(50, 201, 10).tolist()
     return [
         {
             "id": i,
             "round_number": i,
-            "timestamp": (datetime.now(timezone.utc) - timedelta(minutes=i*5)).isoformat(),
+            "timestamp": (now - timedelta(minutes=i*5)).isoformat(),
             "success": i % 4 != 0,
-            "participants": random.randint(3, 5),
-            "duration_ms": random.randint(50, 200),
+            "participants": participants[i - 1],
+            "duration_ms": durations[i - 1],
             "votes": {},
             "result": {},
             "byzantine_nodes": [],
@@ -646,22 +1211,48 @@ async def list_consensus_rounds():
         for i in range(1, 11)
     ]
 
+# The rounds are built at import and only re-stamped once a minute, so their
+# timestamps stay recent without per-request work
+CONSENSUS_ROUNDS_TTL = 60.0
+_cached_json("consensus_rounds", CONSENSUS_ROUNDS_TTL, _build_consensus_rounds)
+
+@app.get("/api/consensus/rounds")
+async def list_consensus_rounds(request: Request):
+    return _cached_json("consensus_rounds", CONSENSUS_ROUNDS_TTL, _build_consensus_rounds, request)
+
 @app.get("/api/consensus/stats/summary")
-async def consensus_summary():
-    return {
-        "total_rounds": 10,
-        "successful_rounds": 7,
-        "success_rate": 70.0,
-        "average_duration_ms": 125.0,
-        "average_participants": 4.0
-    }
+async def consensus_summary(request: Request):
+    return _conditional_json(request, CONSENSUS_SUMMARY_JSON, CONSENSUS_SUMMARY_ETAG)
 
 if __name__ == "__main__":
     import uvicorn
     port = 8000  # Changed from 8000 to avoid port conflict
-    print("🚀 Starting EDGE-QI Backend Server...")
-    print("✅ Server started successfully (mock data mode)")
-    print(f"📡 API: http://localhost:{port}")
-    print(f"📚 Docs: http://localhost:{port}/docs")
-    print(f"🔌 WebSocket: ws://localhost:{port}/socket.io")
-    uvicorn.run(socket_app, host="0.0.0.0", port=port, log_level="info")
+    print(
+        "🚀 Starting EDGE-QI Backend Server...\n"
+        f"📡 API: http://localhost:{port}\n"
+        + ("" if PRODUCTION else f"📚 Docs: http://localhost:{port}/docs\n")
+        + f"🔌 WebSocket: ws://localhost:{port}/socket.io"
+    )
+    # uvloop and httptools (both in uvicorn[standard]) are much faster than the
+    # stdlib loop and h11 for this JSON + WebSocket workload.
+    # This server keeps the demo stream, client count and anomaly stats in
+    # process and has no cross-process Socket.IO manager, so it always runs a
+    # single worker; the package app (src/main.py) scales out over Redis.
+    if int(os.getenv("WORKERS", "1")) != 1:
+        logger.warning("⚠️  WORKERS is ignored by server.py (single process only); "
+                       "use src/main.py with Redis for multiple workers")
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "h11"
+    uvicorn.run(socket_app,
+                host="0.0.0.0", port=port,
+                log_level="warning" if PRODUCTION else "info",
+                access_log=not PRODUCTION,
+                loop=loop_impl, http=http_impl)
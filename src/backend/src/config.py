@@ -16,6 +16,8 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     DEBUG: bool = True
+    # More than one worker routes Socket.IO emits through Redis pub/sub
+    WORKERS: int = 1
     
     # CORS Settings
     CORS_ORIGINS: list = ["http://localhost:5173", "http://127.0.0.1:5173"]
@@ -30,6 +32,11 @@ class Settings(BaseSettings):
     REDIS_DB: int = 0
     REDIS_PASSWORD: Optional[str] = None
     
+    @property
+    def REDIS_URL(self) -> str:
+        auth = f":{self.REDIS_PASSWORD}@" if self.REDIS_PASSWORD else ""
+        return f"redis://{auth}{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
+    
     # MQTT Settings
     MQTT_BROKER_HOST: str = "localhost"
     MQTT_BROKER_PORT: int = 1883
@@ -44,6 +51,11 @@ class Settings(BaseSettings):
     # WebSocket Settings
     WS_PING_INTERVAL: int = 25
     WS_PING_TIMEOUT: int = 20
+    # Per-packet Socket.IO/Engine.IO logging; off by default even with DEBUG
+    SIO_DEBUG: bool = False
+    # MessagePack packets instead of JSON text; every client must then use
+    # socket.io-msgpack-parser
+    WS_MSGPACK: bool = False
     
     # Metrics Broadcasting
     METRICS_BROADCAST_INTERVAL: int = 5  # seconds
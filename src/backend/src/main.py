@@ -10,6 +10,7 @@ import asyncio
 from contextlib import asynccontextmanager
 
 from .config import settings
+from .responses import FastJSONResponse
 # from .database import init_db, close_db, get_db
 from .services.websocket_service import ws_service
 from .routers import system, nodes
@@ -29,12 +30,16 @@ async def lifespan(app: FastAPI):
     # Start metrics broadcaster in background (skip for now)
     # asyncio.create_task(ws_service.start_metrics_broadcaster(get_db))
     
+    # Mock status broadcast until the database-backed one is enabled
+    status_task = asyncio.create_task(system.broadcast_status_loop())
+    
     print("✅ Server started successfully (without database)")
     
     yield
     
     # Shutdown
     print("🛑 Shutting down EDGE-QI Backend Server...")
+    status_task.cancel()
     # await close_db()
     print("✅ Server shutdown complete")
 
@@ -46,7 +51,8 @@ app = FastAPI(
     version=settings.API_VERSION,
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # CORS middleware
@@ -108,10 +114,27 @@ async def health():
 if __name__ == "__main__":
     import uvicorn
     
+    # uvloop and httptools (both in uvicorn[standard]) are much faster than
+    # the stdlib loop and h11; uvloop isn't available on Windows
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "h11"
+    
     uvicorn.run(
         "main:socket_app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG,
-        log_level="info"
+        # uvicorn ignores workers while reloading; reload only with one worker
+        reload=settings.DEBUG and settings.WORKERS == 1,
+        workers=settings.WORKERS,
+        log_level="info",
+        loop=loop_impl,
+        http=http_impl
     )
@@ -1,7 +1,7 @@
 """
 Database models for EDGE-QI system
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Boolean, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..database import Base
@@ -13,7 +13,7 @@ class EdgeNode(Base):
     
     id = Column(String(50), primary_key=True)
     name = Column(String(100), nullable=False)
-    status = Column(String(20), default="idle")  # active, idle, fault
+    status = Column(String(20), default="idle", index=True)  # active, idle, fault
     location = Column(String(200))
     
     # Resource metrics
@@ -47,6 +47,11 @@ class EdgeNode(Base):
 class Detection(Base):
     """Detection result model"""
     __tablename__ = "detections"
+    __table_args__ = (
+        # Per-node / per-type listings, newest first
+        Index('ix_detections_node_ts', 'node_id', 'timestamp'),
+        Index('ix_detections_type_ts', 'object_type', 'timestamp'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     timestamp = Column(DateTime, default=datetime.utcnow, index=True)
@@ -127,6 +132,11 @@ class ConsensusRound(Base):
 class SystemLog(Base):
     """System log model"""
     __tablename__ = "system_logs"
+    __table_args__ = (
+        # Per-node / per-source log listings, newest first
+        Index('ix_system_logs_node_ts', 'node_id', 'timestamp'),
+        Index('ix_system_logs_source_ts', 'source', 'timestamp'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     timestamp = Column(DateTime, default=datetime.utcnow, index=True)
@@ -0,0 +1,37 @@
+"""
+JSON encoding helpers for API responses
+"""
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+# orjson is much faster for the dict/list payloads served here; stdlib json
+# is the fallback
+try:
+    import orjson
+
+    def dumps(obj) -> bytes:
+        """Encode obj as compact JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    import json
+
+    def dumps(obj) -> bytes:
+        """Encode obj as compact JSON bytes"""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class: renders through dumps()"""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def json_response(body: bytes) -> Response:
+    """Response for an already-encoded JSON body"""
+    return Response(body, media_type="application/json")
+
+
+def json_array(items) -> bytes:
+    """Join individually encoded JSON values into one JSON array"""
+    return b"[" + b",".join(items) + b"]"
@@ -1,108 +1,252 @@
 """
 Detection, Analytics, Logs, Consensus routers with mock data
 """
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 from datetime import datetime, timedelta
+from typing import Optional
 import random
 
+import numpy as np
+
+from ..config import settings
+from ..responses import dumps, json_response, json_array
+from ..services.cache_service import cache_service
+
+# Mock timestamps are offsets from a single clock reading
+_NOW = datetime.utcnow()
+
+_rng = np.random.default_rng()
+_OBJECT_TYPES = ["car", "person", "bicycle", "motorcycle", "bus"]
+
 # Detection Router
 detection_router = APIRouter()
 
-MOCK_DETECTIONS = [
-    {
-        "id": i,
-        "timestamp": (datetime.utcnow() - timedelta(minutes=i*2)).isoformat(),
-        "node_id": f"edge-node-{random.randint(1, 5)}",
-        "stream_id": f"stream-{random.randint(1, 3)}",
-        "object_type": random.choice(["car", "person", "bicycle", "motorcycle", "bus"]),
-        "confidence": round(random.uniform(0.85, 0.99), 2),
-        "bbox": {"x": random.randint(0, 1000), "y": random.randint(0, 1000), "width": random.randint(50, 200), "height": random.randint(50, 200)},
-        "location": f"Location {random.randint(1, 5)}"
-    }
-    for i in range(1, 51)
-]
+# Detections are held column-wise (struct of arrays): filters are boolean
+# masks and aggregates are bincount/mean over a column, with no per-row dict
+# access. Categorical columns store indexes into the label lists.
+_N_DETECTIONS = 50
+_DET_NODE_IDS = [f"edge-node-{i}" for i in range(1, 6)]
+_DET_STREAM_IDS = [f"stream-{i}" for i in range(1, 4)]
+_DET_LOCATIONS = [f"Location {i}" for i in range(1, 6)]
+
+_DET_IDS = np.arange(1, _N_DETECTIONS + 1)
+_DET_TS = _DET_IDS * 2  # minutes before _NOW
+_DET_NODE = _rng.integers(0, len(_DET_NODE_IDS), _N_DETECTIONS).astype(np.int8)
+_DET_STREAM = _rng.integers(0, len(_DET_STREAM_IDS), _N_DETECTIONS).astype(np.int8)
+_DET_TYPE = _rng.integers(0, len(_OBJECT_TYPES), _N_DETECTIONS).astype(np.int8)
+_DET_LOCATION = _rng.integers(0, len(_DET_LOCATIONS), _N_DETECTIONS).astype(np.int8)
+# Kept as float64 so the rounded values encode exactly as two decimals
+_DET_CONF = _rng.uniform(0.85, 0.99, _N_DETECTIONS).round(2)
+
+# Each bbox is packed into one uint64, 16 bits per field: x | y<<16 |
+# width<<32 | height<<48. Fields are recovered with a shift and mask, so ROI
+# tests run over a single column without branches.
+_BBOX_SHIFTS = np.array([0, 16, 32, 48], dtype=np.uint64)
+_FIELD_MASK = np.uint64(0xFFFF)
+
+def _pack_bbox(bbox: np.ndarray) -> np.ndarray:
+    """(N, 4) x/y/width/height array -> (N,) uint64"""
+    bbox = np.asarray(bbox)
+    if bbox.size and (bbox.min() < 0 or bbox.max() > 0xFFFF):
+        # Would be truncated (or bleed into the neighbouring field)
+        raise ValueError("bbox fields must be in 0..65535")
+    fields = (bbox.astype(np.uint64) & _FIELD_MASK) << _BBOX_SHIFTS
+    return np.bitwise_or.reduce(fields, axis=1)
+
+def _bbox_field(packed: np.ndarray, field: int) -> np.ndarray:
+    return ((packed >> _BBOX_SHIFTS[field]) & _FIELD_MASK).astype(np.int32)
+
+_DET_BBOX = _pack_bbox(np.column_stack((
+    _rng.integers(0, 1001, (_N_DETECTIONS, 2)),
+    _rng.integers(50, 201, (_N_DETECTIONS, 2))
+)))
+
+def _detection_rows():
+    """Rehydrate the columns into the API's per-detection dicts"""
+    return [
+        {
+            "id": i,
+            "timestamp": (_NOW - timedelta(minutes=ts)).isoformat(),
+            "node_id": _DET_NODE_IDS[node],
+            "stream_id": _DET_STREAM_IDS[stream],
+            "object_type": _OBJECT_TYPES[obj],
+            "confidence": conf,
+            "bbox": {"x": x, "y": y, "width": w, "height": h},
+            "location": _DET_LOCATIONS[loc]
+        }
+        for i, ts, node, stream, obj, conf, x, y, w, h, loc in zip(
+            _DET_IDS.tolist(), _DET_TS.tolist(), _DET_NODE.tolist(),
+            _DET_STREAM.tolist(), _DET_TYPE.tolist(), _DET_CONF.tolist(),
+            *(_bbox_field(_DET_BBOX, f).tolist() for f in range(4)),
+            _DET_LOCATION.tolist()
+        )
+    ]
+
+MOCK_DETECTIONS = _detection_rows()
+
+# The mock payloads never change after import: encode them once. Each
+# detection is encoded separately so any limit is a byte join, not a re-encode.
+_DETECTION_ITEMS = [dumps(d) for d in MOCK_DETECTIONS]
+MOCK_DETECTIONS_JSON = json_array(_DETECTION_ITEMS)
+DETECTION_SUMMARY_JSON = dumps({
+    "total": _N_DETECTIONS,
+    "time_range": "24h",
+    "average_confidence": round(float(_DET_CONF.mean()), 2),
+    "by_type": dict(zip(_OBJECT_TYPES, np.bincount(_DET_TYPE, minlength=len(_OBJECT_TYPES)).tolist()))
+})
+
+def _label_index(labels, value):
+    return labels.index(value) if value in labels else -1
+
+def _roi_mask(packed: np.ndarray, x0: int, y0: int, x1: int, y1: int) -> np.ndarray:
+    """Boxes in packed that lie entirely inside the ROI rectangle"""
+    x = _bbox_field(packed, 0)
+    y = _bbox_field(packed, 1)
+    return (
+        (x >= x0) & (y >= y0)
+        & (x + _bbox_field(packed, 2) <= x1)
+        & (y + _bbox_field(packed, 3) <= y1)
+    )
 
 @detection_router.get("/")
-async def list_detections(limit: int = Query(100)):
-    return MOCK_DETECTIONS[:limit]
+async def list_detections(
+    node_id: Optional[str] = Query(None),
+    object_type: Optional[str] = Query(None),
+    roi: Optional[str] = Query(None, description="Region of interest: x0,y0,x1,y1"),
+    limit: int = Query(100)
+):
+    if node_id is None and object_type is None and roi is None:
+        if limit >= _N_DETECTIONS:
+            return json_response(MOCK_DETECTIONS_JSON)
+        return json_response(json_array(_DETECTION_ITEMS[:limit]))
+    mask = np.ones(_N_DETECTIONS, dtype=bool)
+    if node_id is not None:
+        mask &= _DET_NODE == _label_index(_DET_NODE_IDS, node_id)
+    if object_type is not None:
+        mask &= _DET_TYPE == _label_index(_OBJECT_TYPES, object_type)
+    if roi is not None:
+        try:
+            x0, y0, x1, y1 = (int(v) for v in roi.split(","))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="roi must be x0,y0,x1,y1")
+        if x1 < x0 or y1 < y0:
+            raise HTTPException(status_code=400, detail="roi corners are inverted")
+        mask &= _roi_mask(_DET_BBOX, x0, y0, x1, y1)
+    rows = np.flatnonzero(mask)[:limit].tolist()
+    return json_response(json_array([_DETECTION_ITEMS[r] for r in rows]))
 
 @detection_router.get("/stats/summary")
 async def detection_summary():
-    return {
-        "total": len(MOCK_DETECTIONS),
-        "time_range": "24h",
-        "average_confidence": 0.92,
-        "by_type": {"car": 20, "person": 15, "bicycle": 10, "motorcycle": 3, "bus": 2}
-    }
+    return json_response(DETECTION_SUMMARY_JSON)
 
 
 # Analytics Router
 analytics_router = APIRouter()
 
-@analytics_router.get("/data")
-async def analytics_data():
+_HOURS = [f"{h}:00" for h in range(24)]
+_NODE_NAMES = [f"Node {i}" for i in range(1, 6)]
+
+def _build_analytics_data():
+    # Draw every series in one vectorized call each; tolist() hands back
+    # plain Python numbers for the encoder
+    detections = _rng.integers(10, 51, 24).tolist()
+    latency = _rng.uniform(20, 80, 24).round(1).tolist()
+    bandwidth = _rng.uniform(50, 200, 24).round(1).tolist()
+    energy = _rng.uniform(1, 10, 24).round(1).tolist()
+    distribution = _rng.integers(5, 31, len(_OBJECT_TYPES)).tolist()
+    activity = _rng.integers(50, 301, len(_NODE_NAMES)).tolist()
     return {
-        "traffic_trends": [{"time": f"{h}:00", "detections": random.randint(10, 50)} for h in range(24)],
-        "performance_metrics": [{"time": f"{h}:00", "latency": round(random.uniform(20, 80), 1)} for h in range(24)],
-        "detection_distribution": [{"name": obj, "value": random.randint(5, 30)} for obj in ["car", "person", "bicycle", "motorcycle", "bus"]],
-        "bandwidth_comparison": [{"time": f"{h}:00", "saved": round(random.uniform(50, 200), 1)} for h in range(24)],
-        "energy_efficiency": [{"time": f"{h}:00", "saved": round(random.uniform(1, 10), 1)} for h in range(24)],
-        "node_activity": [{"node": f"Node {i}", "detections": random.randint(50, 300)} for i in range(1, 6)]
+        "traffic_trends": [{"time": t, "detections": d} for t, d in zip(_HOURS, detections)],
+        "performance_metrics": [{"time": t, "latency": v} for t, v in zip(_HOURS, latency)],
+        "detection_distribution": [{"name": n, "value": v} for n, v in zip(_OBJECT_TYPES, distribution)],
+        "bandwidth_comparison": [{"time": t, "saved": v} for t, v in zip(_HOURS, bandwidth)],
+        "energy_efficiency": [{"time": t, "saved": v} for t, v in zip(_HOURS, energy)],
+        "node_activity": [{"node": n, "detections": v} for n, v in zip(_NODE_NAMES, activity)]
     }
 
+@analytics_router.get("/data")
+async def analytics_data():
+    # Served from the shared cache for METRICS_BROADCAST_INTERVAL seconds
+    cached = await cache_service.get("analytics:data")
+    if cached is not None:
+        return json_response(cached)
+    body = dumps(_build_analytics_data())
+    await cache_service.set("analytics:data", body, ttl=settings.METRICS_BROADCAST_INTERVAL)
+    return json_response(body)
+
 
 # Logs Router
 logs_router = APIRouter()
 
-MOCK_LOGS = [
-    {
-        "id": i,
-        "timestamp": (datetime.utcnow() - timedelta(minutes=i*3)).isoformat(),
-        "level": random.choice(["info", "warning", "error"]),
-        "source": random.choice(["api", "detection", "system", "network"]),
-        "message": random.choice([
-            "System started successfully",
-            "Node heartbeat received",
-            "Detection processed",
-            "High CPU usage detected",
-            "Network latency increased"
-        ])
-    }
-    for i in range(1, 31)
-]
+_LOG_LEVELS = np.array(["info", "warning", "error"])
+_LOG_SOURCES = np.array(["api", "detection", "system", "network"])
+_LOG_MESSAGES = np.array([
+    "System started successfully",
+    "Node heartbeat received",
+    "Detection processed",
+    "High CPU usage detected",
+    "Network latency increased"
+])
+
+def _build_mock_logs(n: int = 30):
+    levels = _rng.choice(_LOG_LEVELS, n).tolist()
+    sources = _rng.choice(_LOG_SOURCES, n).tolist()
+    messages = _rng.choice(_LOG_MESSAGES, n).tolist()
+    return [
+        {
+            "id": i,
+            "timestamp": (_NOW - timedelta(minutes=i*3)).isoformat(),
+            "level": level,
+            "source": source,
+            "message": message
+        }
+        for i, level, source, message in zip(range(1, n + 1), levels, sources, messages)
+    ]
+
+MOCK_LOGS = _build_mock_logs()
+
+_LOG_ITEMS = [dumps(log) for log in MOCK_LOGS]
+MOCK_LOGS_JSON = json_array(_LOG_ITEMS)
 
 @logs_router.get("/")
 async def list_logs(limit: int = Query(100)):
-    return MOCK_LOGS[:limit]
+    if limit >= len(_LOG_ITEMS):
+        return json_response(MOCK_LOGS_JSON)
+    return json_response(json_array(_LOG_ITEMS[:limit]))
 
 
 # Consensus Router
 consensus_router = APIRouter()
 
+MOCK_CONSENSUS_ROUNDS = [
+    {
+        "id": i,
+        "round_number": i,
+        "timestamp": (_NOW - timedelta(minutes=i*5)).isoformat(),
+        "success": i % 4 != 0,  # 75% success rate
+        "participants": random.randint(3, 5),
+        "duration_ms": random.randint(50, 200),
+        "votes": {},
+        "result": {},
+        "byzantine_nodes": [],
+        "fault_tolerance_level": 0.8
+    }
+    for i in range(1, 11)
+]
+
+MOCK_CONSENSUS_ROUNDS_JSON = dumps(MOCK_CONSENSUS_ROUNDS)
+CONSENSUS_SUMMARY_JSON = dumps({
+    "total_rounds": 10,
+    "successful_rounds": 7,
+    "success_rate": 70.0,
+    "average_duration_ms": 125.0,
+    "average_participants": 4.0
+})
+
 @consensus_router.get("/rounds")
 async def list_consensus_rounds():
-    return [
-        {
-            "id": i,
-            "round_number": i,
-            "timestamp": (datetime.utcnow() - timedelta(minutes=i*5)).isoformat(),
-            "success": i % 4 != 0,  # 75% success rate
-            "participants": random.randint(3, 5),
-            "duration_ms": random.randint(50, 200),
-            "votes": {},
-            "result": {},
-            "byzantine_nodes": [],
-            "fault_tolerance_level": 0.8
-        }
-        for i in range(1, 11)
-    ]
+    return json_response(MOCK_CONSENSUS_ROUNDS_JSON)
 
 @consensus_router.get("/stats/summary")
 async def consensus_summary():
-    return {
-        "total_rounds": 10,
-        "successful_rounds": 7,
-        "success_rate": 70.0,
-        "average_duration_ms": 125.0,
-        "average_participants": 4.0
-    }
+    return json_response(CONSENSUS_SUMMARY_JSON)
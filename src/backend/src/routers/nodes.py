@@ -6,9 +6,13 @@ from typing import List, Optional
 from datetime import datetime
 import random
 
+from ..responses import dumps, json_response
+
 router = APIRouter()
 
-# Mock data
+# Mock data (one clock reading shared by every timestamp)
+_NOW_ISO = datetime.utcnow().isoformat()
+
 MOCK_NODES = [
     {
         "id": f"edge-node-{i}",
@@ -26,26 +30,32 @@ MOCK_NODES = [
         "total_detections": random.randint(100, 1000),
         "average_latency": random.uniform(20, 80),
         "uptime": random.uniform(80, 100),
-        "last_heartbeat": datetime.utcnow().isoformat(),
-        "created_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat()
+        "last_heartbeat": _NOW_ISO,
+        "created_at": _NOW_ISO,
+        "updated_at": _NOW_ISO
     }
     for i in range(1, 6)
 ]
 
+# Encoded once: the node list is constant after import
+MOCK_NODES_JSON = dumps(MOCK_NODES)
+
+# Lookup indexes, so requests never scan the node list
+_NODES_BY_ID = {n["id"]: n for n in MOCK_NODES}
+_NODES_BY_STATUS = {}
+for _node in MOCK_NODES:
+    _NODES_BY_STATUS.setdefault(_node["status"], []).append(_node)
+
 
 @router.get("/")
 async def list_nodes(status: Optional[str] = Query(None)):
     """List all edge nodes"""
     if status:
-        return [n for n in MOCK_NODES if n["status"] == status]
-    return MOCK_NODES
+        return _NODES_BY_STATUS.get(status, [])
+    return json_response(MOCK_NODES_JSON)
 
 
 @router.get("/{node_id}")
 async def get_node(node_id: str):
     """Get specific edge node by ID"""
-    for node in MOCK_NODES:
-        if node["id"] == node_id:
-            return node
-    return {"error": "Node not found"}
+    return _NODES_BY_ID.get(node_id) or {"error": "Node not found"}
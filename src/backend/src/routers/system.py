@@ -3,29 +3,82 @@ System API endpoints
 """
 from fastapi import APIRouter
 from datetime import datetime
+from typing import Optional
+import asyncio
+import logging
+
+from ..config import settings
+from ..responses import dumps, json_response
+from ..services.cache_service import cache_service
+from ..services.websocket_service import ws_service
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Mock status metrics; only the timestamp changes between snapshots
+_STATUS = {
+    'total_nodes': 5,
+    'active_nodes': 4,
+    'idle_nodes': 1,
+    'fault_nodes': 0,
+    'total_detections': 1234,
+    'detections_per_second': 2.5,
+    'average_latency': 45.2,
+    'average_cpu': 62.5,
+    'average_memory': 58.3,
+    'bandwidth_saved': 234.5,
+    'energy_saved': 12.3
+}
+# Encoded once with the timestamp spliced in per snapshot
+_STATUS_PREFIX = dumps(_STATUS)[:-1] + b',"timestamp":"'
+_STATUS_SUFFIX = b'"}'
+
+# Latest snapshot, refreshed by broadcast_status_loop()
+_latest_status: Optional[dict] = None
+_latest_status_json: Optional[bytes] = None
+
+NODES_SUMMARY_JSON = dumps({
+    'total': 5,
+    'active': 4,
+    'idle': 1,
+    'fault': 0,
+    'total_detections': 1234,
+    'average_cpu': 62.5,
+    'average_memory': 58.3,
+    'total_energy': 456.7
+})
+
+
+def _refresh_status() -> dict:
+    global _latest_status, _latest_status_json
+    timestamp = datetime.utcnow().isoformat()
+    _latest_status = {**_STATUS, 'timestamp': timestamp}
+    _latest_status_json = _STATUS_PREFIX + timestamp.encode() + _STATUS_SUFFIX
+    return _latest_status
+
+
+async def broadcast_status_loop():
+    """
+    Refresh the status snapshot and push it to the 'metrics' room once per
+    METRICS_BROADCAST_INTERVAL, independent of how often it is requested
+    """
+    while True:
+        try:
+            await ws_service.broadcast_system_metrics(_refresh_status())
+        except Exception as e:
+            logger.error("Error broadcasting system status: %s", e)
+        await asyncio.sleep(settings.METRICS_BROADCAST_INTERVAL)
+
 
 @router.get("/status")
 async def system_status():
     """
     Get current system metrics (mock data for now)
     """
-    return {
-        'total_nodes': 5,
-        'active_nodes': 4,
-        'idle_nodes': 1,
-        'fault_nodes': 0,
-        'total_detections': 1234,
-        'detections_per_second': 2.5,
-        'average_latency': 45.2,
-        'average_cpu': 62.5,
-        'average_memory': 58.3,
-        'bandwidth_saved': 234.5,
-        'energy_saved': 12.3,
-        'timestamp': datetime.utcnow().isoformat()
-    }
+    if _latest_status_json is None:
+        _refresh_status()
+    return json_response(_latest_status_json)
 
 
 @router.get("/health")
@@ -48,13 +101,12 @@ async def nodes_summary():
     """
     Get node summary statistics (mock data)
     """
-    return {
-        'total': 5,
-        'active': 4,
-        'idle': 1,
-        'fault': 0,
-        'total_detections': 1234,
-        'average_cpu': 62.5,
-        'average_memory': 58.3,
-        'total_energy': 456.7
-    }
+    return json_response(NODES_SUMMARY_JSON)
+
+
+@router.get("/cache/stats")
+async def cache_stats():
+    """
+    Response cache hit/miss counters (this worker)
+    """
+    return cache_service.get_stats()
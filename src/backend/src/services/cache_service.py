@@ -0,0 +1,90 @@
+"""
+Redis-backed cache for encoded API responses
+"""
+import logging
+import time
+from typing import Optional
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheService:
+    """
+    Short-TTL byte cache shared by all workers through Redis.
+
+    Caching is best effort: when redis-py is missing or the server can't be
+    reached, get() misses and set() is a no-op, so callers just rebuild.
+    """
+
+    # After a connection error, skip Redis for this long instead of paying a
+    # connect timeout on every request
+    RETRY_AFTER = 30.0
+
+    def __init__(self):
+        self._client = None
+        self._down_until = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    def _get_client(self):
+        if not REDIS_AVAILABLE or time.monotonic() < self._down_until:
+            return None
+        if self._client is None:
+            self._client = aioredis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                password=settings.REDIS_PASSWORD,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5
+            )
+        return self._client
+
+    def _mark_down(self, e: Exception):
+        logger.warning("Redis cache unavailable, retrying in %.0fs: %s", self.RETRY_AFTER, e)
+        self._down_until = time.monotonic() + self.RETRY_AFTER
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Cached bytes for key, or None on a miss"""
+        client = self._get_client()
+        value = None
+        if client is not None:
+            try:
+                value = await client.get(key)
+            except Exception as e:
+                self._mark_down(e)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        """Store value under key for ttl seconds"""
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            await client.set(key, value, px=int(ttl * 1000))
+        except Exception as e:
+            self._mark_down(e)
+
+    def get_stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0
+        }
+
+
+# Global cache service instance
+cache_service = CacheService()
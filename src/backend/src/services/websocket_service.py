@@ -3,18 +3,40 @@ WebSocket service for real-time updates
 """
 import socketio
 import asyncio
+import logging
 from datetime import datetime
 from typing import Dict, Any, List
 from collections import deque
+from urllib.parse import parse_qs
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+# Rooms a client may subscribe to. Clients that don't say otherwise are put in
+# all of them on connect, so existing dashboards keep receiving everything.
+ROOMS = ('metrics',)
 
 
 class WebSocketService:
     def __init__(self):
+        # With several workers each process only holds its own sockets; the
+        # Redis manager relays every emit to all of them over pub/sub
+        client_manager = None
+        if settings.WORKERS > 1:
+            client_manager = socketio.AsyncRedisManager(settings.REDIS_URL)
+        
         self.sio = socketio.AsyncServer(
             async_mode='asgi',
+            client_manager=client_manager,
             cors_allowed_origins='*',
-            logger=True,
-            engineio_logger=False
+            # Per-packet logging writes synchronously from the event loop;
+            # only wanted while debugging the socket layer itself
+            logger=settings.SIO_DEBUG,
+            engineio_logger=settings.SIO_DEBUG,
+            # Numeric-heavy payloads like system_metrics pack noticeably
+            # smaller as MessagePack; opt-in because clients must match
+            serializer='msgpack' if settings.WS_MSGPACK else 'default'
         )
         
         # In-memory storage for recent data
@@ -30,7 +52,18 @@ class WebSocketService:
         
         @self.sio.event
         async def connect(sid, environ):
-            print(f"✅ Client connected: {sid}")
+            logger.debug("Client connected: %s", sid)
+            
+            # ?subscribe=metrics,... picks rooms up front; absent means all
+            query = parse_qs(environ.get('QUERY_STRING', ''), keep_blank_values=True)
+            if 'subscribe' in query:
+                rooms = ','.join(query['subscribe']).split(',')
+            else:
+                rooms = ROOMS
+            for room in rooms:
+                if room in ROOMS:
+                    await self.sio.enter_room(sid, room)
+            
             await self.sio.emit('connection_established', {
                 'status': 'connected',
                 'timestamp': datetime.utcnow().isoformat()
@@ -41,7 +74,21 @@ class WebSocketService:
         
         @self.sio.event
         async def disconnect(sid):
-            print(f"❌ Client disconnected: {sid}")
+            logger.debug("Client disconnected: %s", sid)
+        
+        @self.sio.event
+        async def subscribe(sid, data):
+            """Join a broadcast room, e.g. {'room': 'metrics'}"""
+            room = data.get('room')
+            if room in ROOMS:
+                await self.sio.enter_room(sid, room)
+        
+        @self.sio.event
+        async def unsubscribe(sid, data):
+            """Leave a broadcast room"""
+            room = data.get('room')
+            if room in ROOMS:
+                await self.sio.leave_room(sid, room)
         
         @self.sio.event
         async def request_data(sid, data):
@@ -76,8 +123,10 @@ class WebSocketService:
                 await self.sio.emit('alert', alert, room=sid)
     
     async def broadcast_system_metrics(self, metrics: Dict[str, Any]):
-        """Broadcast system metrics to all connected clients"""
-        await self.sio.emit('system_metrics', metrics)
+        """Broadcast system metrics to clients in the 'metrics' room"""
+        # Every worker runs its own broadcaster, so each only reaches the
+        # sockets it holds rather than relaying through the Redis manager
+        await self.sio.emit('system_metrics', metrics, room='metrics', ignore_queue=True)
     
     async def broadcast_node_update(self, node_data: Dict[str, Any]):
         """Broadcast node status update"""
@@ -129,7 +178,6 @@ class WebSocketService:
     
     async def start_metrics_broadcaster(self, db_getter):
         """Background task to broadcast metrics periodically"""
-        from ..config import settings
         from .system_service import get_system_metrics
         
         while True:
@@ -150,7 +198,7 @@ class WebSocketService:
                 await asyncio.sleep(settings.METRICS_BROADCAST_INTERVAL)
                 
             except Exception as e:
-                print(f"❌ Error broadcasting metrics: {e}")
+                logger.error("Error broadcasting metrics: %s", e)
                 await asyncio.sleep(settings.METRICS_BROADCAST_INTERVAL)
 
 
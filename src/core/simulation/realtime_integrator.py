@@ -10,11 +10,22 @@ import numpy as np
 import asyncio
 import threading
 import time
+from collections import Counter
 from typing import Dict, List, Optional, Callable, Any
 from dataclasses import dataclass
 
 from .realtime_simulator import RealTimeDataSimulator
 
+# Optional libjpeg-turbo encoder (SIMD JPEG), falls back to cv2.imencode
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _turbo_jpeg = TurboJPEG()
+    TURBOJPEG_AVAILABLE = True
+except Exception:
+    # ImportError, or the shared library could not be located
+    _turbo_jpeg = None
+    TURBOJPEG_AVAILABLE = False
+
 # Import EDGE-QI components with error handling
 try:
     from Core.queue.queue_detector import QueueDetector
@@ -62,6 +73,35 @@ class RealTimeConfig:
     enable_bandwidth_optimization: bool = True
     traffic_density: float = 0.5
     detection_confidence_threshold: float = 0.6
+    enable_frame_encoding: bool = True
+    jpeg_quality: int = 75
+
+@dataclass
+class FrameSnapshot:
+    """
+    Structure-of-arrays view of one frame's detections
+    
+    Built once per processed frame so consumers can filter with vectorized
+    masks (e.g. ``snap.confidences > 0.6``) instead of per-detection dict lookups.
+    """
+    bboxes: np.ndarray       # (N, 4) float32 - x, y, width, height
+    confidences: np.ndarray  # (N,) float32
+    classes: np.ndarray      # (N,) object - class names
+    speeds: np.ndarray       # (N,) float32
+    
+    @classmethod
+    def from_detections(cls, detections: List[Dict]) -> 'FrameSnapshot':
+        """Build a snapshot from simulator detection dicts"""
+        n = len(detections)
+        return cls(
+            bboxes=np.array([d['bbox'] for d in detections], dtype=np.float32).reshape(n, 4),
+            confidences=np.fromiter((d['confidence'] for d in detections), dtype=np.float32, count=n),
+            classes=np.array([d['class'] for d in detections], dtype=object),
+            speeds=np.fromiter((d.get('speed', 0) for d in detections), dtype=np.float32, count=n)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.confidences)
 
 class RealTimeDataIntegrator:
     """
@@ -109,6 +149,9 @@ class RealTimeDataIntegrator:
         # Real-time data storage
         self.latest_frame = None
         self.latest_detections = []
+        self.latest_snapshot = FrameSnapshot.from_detections([])
+        self.detections_version = 0
+        self._type_counts_cache = (-1, {})
         self.latest_queue_data = []
         self.latest_traffic_data = {}
         self.latest_sensor_data = {}
@@ -211,13 +254,20 @@ class RealTimeDataIntegrator:
                 # Get latest frame
                 frame_data = self.simulator.get_latest_frame()
                 if frame_data is None:
-                    time.sleep(0.01)
+                    # Block until the simulator publishes a frame; the timeout
+                    # keeps the loop responsive to stop requests
+                    self.simulator.frame_event.wait(timeout=1.0)
+                    self.simulator.frame_event.clear()
                     continue
                 
                 frame = frame_data['frame']
                 camera_id = frame_data['camera_id']
                 timestamp = frame_data['timestamp']
                 
+                # Encode once here so every reader shares the same JPEG bytes
+                if self.config.enable_frame_encoding:
+                    frame_data['jpeg'] = self._encode_jpeg(frame)
+                
                 self.latest_frame = frame_data
                 
                 # Process frame through EDGE-QI pipeline
@@ -238,6 +288,13 @@ class RealTimeDataIntegrator:
                 print(f"⚠️ Processing error: {e}")
                 time.sleep(0.1)
     
+    def _encode_jpeg(self, frame: np.ndarray) -> Optional[bytes]:
+        """Encode frame as JPEG for streaming consumers"""
+        if _turbo_jpeg is not None:
+            return _turbo_jpeg.encode(frame, quality=self.config.jpeg_quality, pixel_format=TJPF_BGR)
+        ok, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, self.config.jpeg_quality])
+        return buffer.tobytes() if ok else None
+    
     def _process_frame(self, frame: np.ndarray, camera_id: str, timestamp: float):
         """Process individual frame through EDGE-QI pipeline"""
         
@@ -246,6 +303,8 @@ class RealTimeDataIntegrator:
         if detection_data and detection_data.get('camera_id') == camera_id:
             detections = detection_data['detections']
             self.latest_detections = detections
+            self.latest_snapshot = FrameSnapshot.from_detections(detections)
+            self.detections_version += 1
             self.processing_stats['detections_made'] += len(detections)
         
         # 2. Queue Detection
@@ -434,21 +493,47 @@ class RealTimeDataIntegrator:
         """Get the current processed frame"""
         return self.latest_frame['frame'] if self.latest_frame else None
     
+    def get_frame_as_bytes(self) -> Optional[bytes]:
+        """Get the current frame as JPEG bytes (encoded once per frame by the processing loop)"""
+        frame_data = self.latest_frame
+        return frame_data.get('jpeg') if frame_data else None
+    
+    # The latest_* containers are replaced wholesale by the processing thread
+    # (never mutated in place), so getters hand out the current reference
+    # instead of copying on every dashboard read. Treat results as read-only.
     def get_current_detections(self) -> List[Dict]:
-        """Get current object detections"""
-        return self.latest_detections.copy()
+        """Get current object detections (read-only)"""
+        return self.latest_detections
+    
+    def get_current_snapshot(self) -> FrameSnapshot:
+        """Get current detections as a structure-of-arrays snapshot (read-only)"""
+        return self.latest_snapshot
+    
+    def get_detection_type_counts(self) -> Dict[str, int]:
+        """
+        Get detection counts per class, recomputed only when detections change
+        
+        Dashboards can compare ``detections_version`` against the version they
+        last rendered to skip rebuilding per-class charts on unchanged reruns.
+        """
+        version = self.detections_version
+        cached_version, counts = self._type_counts_cache
+        if cached_version != version:
+            counts = dict(Counter(self.latest_snapshot.classes.tolist()))
+            self._type_counts_cache = (version, counts)
+        return counts
     
     def get_current_queue_data(self) -> List[Dict]:
-        """Get current queue detection results"""
-        return self.latest_queue_data.copy()
+        """Get current queue detection results (read-only)"""
+        return self.latest_queue_data
     
     def get_current_traffic_data(self) -> Dict:
-        """Get current traffic analysis results"""
-        return self.latest_traffic_data.copy()
+        """Get current traffic analysis results (read-only)"""
+        return self.latest_traffic_data
     
     def get_current_sensor_data(self) -> Dict:
-        """Get current sensor readings"""
-        return self.latest_sensor_data.copy()
+        """Get current sensor readings (read-only)"""
+        return self.latest_sensor_data
     
     def get_processing_stats(self) -> Dict:
         """Get processing performance statistics"""
@@ -70,6 +70,9 @@ class RealTimeDataSimulator:
         self.detection_queue = Queue(maxsize=100)
         self.sensor_queue = Queue(maxsize=100)
         
+        # Set whenever a frame is published so consumers can block instead of polling
+        self.frame_event = threading.Event()
+        
         # Traffic simulation parameters
         self.traffic_density = 0.3  # 0.0 to 1.0
         self.spawn_probability = 0.1
@@ -172,6 +175,7 @@ class RealTimeDataSimulator:
                             'timestamp': time.time(),
                             'frame_number': getattr(self, f'frame_count_{camera_id}', 0)
                         }, block=False)
+                        self.frame_event.set()
                         
                         # Update frame counter
                         setattr(self, f'frame_count_{camera_id}', 
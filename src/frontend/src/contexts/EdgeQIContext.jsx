@@ -49,8 +49,9 @@ export const EdgeQIProvider = ({ children }) => {
       setConnected(false);
     });
 
+    // The backend only sends the sections that changed, so merge
     newSocket.on('system_metrics', (data) => {
-      setSystemMetrics(data);
+      setSystemMetrics((prev) => ({ ...prev, ...data }));
     });
 
     newSocket.on('edge_node_update', (data) => {
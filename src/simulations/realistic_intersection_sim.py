@@ -13,18 +13,10 @@ Features:
 import streamlit as st
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import pandas as pd
 import time
 import random
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-import json
-from functools import lru_cache
 
 # Configure Streamlit
 st.set_page_config(
@@ -486,6 +478,11 @@ class RealisticIntersectionSimulation:
 
 def create_analytics_dashboard(sim: RealisticIntersectionSimulation):
     """Create comprehensive analytics dashboard"""
+    # Plotly is only needed once analytics are rendered; importing it here
+    # keeps it off the per-rerun module import path.
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
     analytics = st.session_state.analytics_data
     
     if not analytics['timestamps']:
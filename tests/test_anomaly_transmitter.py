@@ -0,0 +1,155 @@
+"""
+Test suite for the backend Anomaly-Driven Transmitter (Algorithm 2)
+
+Covers the ring-buffer baseline window and its running sums, and parity
+between the streaming decisions and the batched replay kernel, including
+the pure-Python fallback used when neither the AOT extension nor numba is
+available.
+"""
+
+import importlib.util
+import statistics
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "src" / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from anomaly_transmitter import AnomalyDrivenTransmitter
+import _anomaly_kernels
+
+
+def _trace(n=300, seed=7):
+    """Normal traffic with occasional jams, as in the demo stream"""
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(5, 16, n)
+    jams = rng.random(n) < 0.08
+    counts[jams] = rng.integers(25, 41, int(jams.sum()))
+    return counts.tolist()
+
+
+def _detections(count):
+    return [{'class_name': 'car'} for _ in range(count)]
+
+
+class TestBaselineWindow:
+    """Test the ring buffer behind the sliding baseline window"""
+
+    def test_window_holds_latest_counts_oldest_first(self):
+        """After wrapping, the window is the last window_size counts in order"""
+        transmitter = AnomalyDrivenTransmitter(window_size=5, min_baseline_samples=3)
+        counts = [3, 1, 4, 1, 5, 9, 2, 6]
+        for count in counts:
+            transmitter.update_baseline(count)
+
+        assert transmitter.vehicle_counts == counts[-5:]
+
+    def test_partial_window(self):
+        """Before the window fills it holds every count seen so far"""
+        transmitter = AnomalyDrivenTransmitter(window_size=10)
+        for count in (4, 8, 15):
+            transmitter.update_baseline(count)
+
+        assert transmitter.vehicle_counts == [4, 8, 15]
+        assert not transmitter.is_baseline_ready
+
+    def test_running_sums_match_window(self):
+        """Running sum / sum of squares track the window through evictions"""
+        transmitter = AnomalyDrivenTransmitter(window_size=7, min_baseline_samples=3)
+        for count in _trace(100):
+            transmitter.update_baseline(count)
+            window = transmitter.vehicle_counts
+            assert transmitter._sum == sum(window)
+            assert transmitter._sum_sq == sum(c * c for c in window)
+
+    def test_baseline_is_population_stats_of_window(self):
+        """Mean and std equal the population statistics of the window"""
+        transmitter = AnomalyDrivenTransmitter(window_size=30, min_baseline_samples=10)
+        for count in _trace(80):
+            transmitter.update_baseline(count)
+
+        window = transmitter.vehicle_counts
+        assert transmitter.baseline_mean == pytest.approx(statistics.fmean(window))
+        assert transmitter.baseline_std == pytest.approx(statistics.pstdev(window))
+
+    def test_zero_variance_uses_unit_std(self):
+        """A constant window falls back to std 1.0 instead of dividing by zero"""
+        transmitter = AnomalyDrivenTransmitter(window_size=10, min_baseline_samples=5)
+        for _ in range(10):
+            transmitter.update_baseline(12)
+
+        assert transmitter.baseline_std == 1.0
+        assert transmitter.calculate_z_score(15) == pytest.approx(3.0)
+
+
+class TestReplayParity:
+    """Test that replay() reproduces the streaming decisions"""
+
+    @pytest.mark.parametrize("window_size,min_samples", [(30, 10), (5, 5), (12, 3)])
+    def test_replay_matches_streaming(self, window_size, min_samples):
+        """Anomaly mask and z-scores agree frame by frame"""
+        counts = _trace()
+        transmitter = AnomalyDrivenTransmitter(
+            window_size=window_size, anomaly_threshold=2.0, min_baseline_samples=min_samples
+        )
+        streamed_flags, streamed_z = [], []
+        for count in counts:
+            _, _, decision = transmitter.should_transmit(_detections(count))
+            streamed_flags.append(decision.is_anomalous)
+            streamed_z.append(decision.z_score)
+
+        mask, z_scores = transmitter.replay(counts)
+
+        assert mask.tolist() == streamed_flags
+        np.testing.assert_allclose(z_scores, streamed_z, rtol=1e-9, atol=1e-9)
+
+    def test_replay_leaves_streaming_state_untouched(self):
+        """replay() doesn't feed the window or the transmission stats"""
+        transmitter = AnomalyDrivenTransmitter(window_size=10)
+        transmitter.replay(_trace(50))
+
+        assert transmitter.vehicle_counts == []
+        assert transmitter.stats.total_frames == 0
+
+
+class TestKernelFallback:
+    """Test the pure-Python kernel used without the AOT extension or numba"""
+
+    @pytest.fixture
+    def fallback_kernels(self, monkeypatch):
+        """Fresh copy of _anomaly_kernels with both native paths unavailable"""
+        monkeypatch.setitem(sys.modules, "anomaly_kernels", None)
+        monkeypatch.setitem(sys.modules, "numba", None)
+        spec = importlib.util.spec_from_file_location(
+            "_anomaly_kernels_fallback", BACKEND_DIR / "_anomaly_kernels.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_fallback_backend_selected(self, fallback_kernels):
+        """Resolution ends at the plain Python source"""
+        assert fallback_kernels.KERNEL_BACKEND == "python"
+        assert fallback_kernels.rolling_zscore_anomalies is fallback_kernels._rolling_zscore_anomalies_py
+
+    def test_fallback_matches_resolved_kernel(self, fallback_kernels):
+        """The fallback gives the same result as whichever kernel is installed"""
+        counts = np.asarray(_trace(), dtype=np.int64)
+        args = (30, 2.0, 10)
+
+        fallback_mask, fallback_z = fallback_kernels.rolling_zscore_anomalies(counts, *args)
+        mask, z_scores = _anomaly_kernels.rolling_zscore_anomalies(counts, *args)
+
+        assert fallback_mask.tolist() == mask.tolist()
+        np.testing.assert_allclose(fallback_z, z_scores, rtol=1e-12)
+
+    def test_no_scores_before_min_samples(self, fallback_kernels):
+        """Frames before min_samples are never anomalous and score 0"""
+        counts = np.array([1, 100, 1, 100, 1, 100], dtype=np.int64)
+        mask, z_scores = fallback_kernels.rolling_zscore_anomalies(counts, 10, 0.5, 4)
+
+        assert not mask[:3].any()
+        assert (z_scores[:3] == 0).all()
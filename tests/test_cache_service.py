@@ -0,0 +1,143 @@
+"""
+Test suite for the backend Redis response cache
+
+Covers the best-effort behaviour when Redis is missing or unreachable
+(misses, no-op sets, retry backoff) and hit/miss accounting.
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "src" / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from src.services import cache_service as cache_module
+from src.services.cache_service import CacheService
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.asyncio.Redis"""
+
+    def __init__(self):
+        self.data = {}
+        self.calls = []
+
+    async def get(self, key):
+        self.calls.append(('get', key))
+        return self.data.get(key)
+
+    async def set(self, key, value, px=None):
+        self.calls.append(('set', key, px))
+        self.data[key] = value
+
+
+class DownRedis(FakeRedis):
+    """Client whose server refuses every connection"""
+
+    async def get(self, key):
+        self.calls.append(('get', key))
+        raise ConnectionError("Connection refused")
+
+    async def set(self, key, value, px=None):
+        self.calls.append(('set', key, px))
+        raise ConnectionError("Connection refused")
+
+
+@pytest.fixture
+def make_cache(monkeypatch):
+    """CacheService wired to the given fake client instead of a real server"""
+    monkeypatch.setattr(cache_module, "REDIS_AVAILABLE", True)
+
+    def factory(client):
+        cache = CacheService()
+        cache._client = client
+        return cache
+    return factory
+
+
+class TestWithoutRedis:
+    """Test the cache when redis-py isn't installed"""
+
+    @pytest.mark.asyncio
+    async def test_get_misses_and_set_is_noop(self, monkeypatch):
+        monkeypatch.setattr(cache_module, "REDIS_AVAILABLE", False)
+        cache = CacheService()
+
+        await cache.set("status", b"{}", ttl=1.0)
+
+        assert await cache.get("status") is None
+        assert cache._client is None
+        assert cache.get_stats() == {'hits': 0, 'misses': 1, 'hit_rate': 0.0}
+
+
+class TestRedisUnreachable:
+    """Test backoff after a connection error"""
+
+    @pytest.mark.asyncio
+    async def test_get_error_is_a_miss(self, make_cache, caplog):
+        """A failing get returns None and logs a warning instead of raising"""
+        cache = make_cache(DownRedis())
+
+        with caplog.at_level(logging.WARNING, logger=cache_module.__name__):
+            assert await cache.get("status") is None
+
+        assert cache.misses == 1
+        assert "Redis cache unavailable" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_set_error_is_swallowed(self, make_cache):
+        cache = make_cache(DownRedis())
+
+        await cache.set("status", b"{}", ttl=1.0)
+
+        assert cache._down_until > 0
+
+    @pytest.mark.asyncio
+    async def test_client_skipped_during_backoff(self, make_cache):
+        """After one failure Redis isn't contacted again until RETRY_AFTER"""
+        client = DownRedis()
+        cache = make_cache(client)
+
+        await cache.get("a")
+        await cache.get("b")
+        await cache.set("c", b"x", ttl=1.0)
+
+        assert client.calls == [('get', 'a')]
+        assert cache.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_retried_after_backoff(self, make_cache, monkeypatch):
+        """Once the backoff has expired the client is used again"""
+        client = DownRedis()
+        cache = make_cache(client)
+        await cache.get("a")
+
+        monkeypatch.setattr(cache, "_down_until", 0.0)
+        await cache.get("b")
+
+        assert client.calls == [('get', 'a'), ('get', 'b')]
+
+
+class TestHitAccounting:
+    """Test get/set against a working server"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_and_stats(self, make_cache):
+        client = FakeRedis()
+        cache = make_cache(client)
+
+        assert await cache.get("status") is None
+        await cache.set("status", b"{}", ttl=1.5)
+        assert await cache.get("status") == b"{}"
+        assert await cache.get("status") == b"{}"
+
+        assert ('set', 'status', 1500) in client.calls
+        assert cache.get_stats() == {'hits': 2, 'misses': 1, 'hit_rate': 0.667}
+
+    def test_empty_stats(self):
+        assert CacheService().get_stats() == {'hits': 0, 'misses': 0, 'hit_rate': 0.0}
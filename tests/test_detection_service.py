@@ -0,0 +1,188 @@
+"""
+Test suite for the backend YOLO detection service
+
+Exercises the service in mock mode (no model loaded): BatchCollector sizing
+and shutdown, and the process_video_stream pipeline's end-of-stream and
+failure handling.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+cv2 = pytest.importorskip("cv2")
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "src" / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+import detection_service
+from detection_service import BatchCollector, YOLODetectionService
+
+
+@pytest.fixture
+def make_service(monkeypatch):
+    """Build services without loading (or downloading) YOLO weights"""
+    monkeypatch.setattr(detection_service, "YOLO_AVAILABLE", False)
+
+    def factory(**kwargs):
+        return YOLODetectionService(device="cpu", **kwargs)
+    return factory
+
+
+def _frame():
+    return np.zeros((48, 64, 3), dtype=np.uint8)
+
+
+class TestBatchCollectorSizing:
+    """Test that batches never exceed what the service was built for"""
+
+    def test_defaults_to_service_max_batch(self, make_service):
+        """Without max_batch the collector uses service.max_batch"""
+        assert BatchCollector(make_service()).max_batch == 1
+        assert BatchCollector(make_service(max_batch=4)).max_batch == 4
+
+    def test_smaller_max_batch_kept(self, make_service):
+        """A max_batch below the service's is honoured"""
+        assert BatchCollector(make_service(max_batch=8), max_batch=2).max_batch == 2
+
+    def test_larger_max_batch_capped(self, make_service):
+        """A max_batch above the service's is capped to it"""
+        assert BatchCollector(make_service(max_batch=2), max_batch=16).max_batch == 2
+
+    @pytest.mark.asyncio
+    async def test_batches_split_at_max_batch(self, make_service):
+        """Frames waiting together are flushed in batches of at most max_batch"""
+        service = make_service(max_batch=4)
+        sizes = []
+
+        def detect_batch(frames, conf=None):
+            sizes.append(len(frames))
+            return [[{'class_name': 'car', 'index': i}] for i in range(len(frames))]
+        service.detect_batch = detect_batch
+
+        collector = BatchCollector(service, max_wait_ms=50)
+        try:
+            results = await asyncio.gather(*(collector.detect(_frame()) for _ in range(6)))
+        finally:
+            await collector.stop()
+
+        assert sizes == [4, 2]
+        assert [r[0]['index'] for r in results] == [0, 1, 2, 3, 0, 1]
+
+
+class TestBatchCollectorStop:
+    """Test that stop() releases every caller waiting on detect()"""
+
+    @pytest.mark.asyncio
+    async def test_stop_fails_queued_and_in_flight_frames(self, make_service):
+        """Frames in the running batch and still queued all get an error"""
+        service = make_service(max_batch=1)
+        started = []
+
+        def slow_detect_batch(frames, conf=None):
+            started.append(len(frames))
+            time.sleep(0.3)
+            return [[] for _ in frames]
+        service.detect_batch = slow_detect_batch
+
+        collector = BatchCollector(service)
+        waiters = [asyncio.create_task(collector.detect(_frame())) for _ in range(3)]
+        await asyncio.sleep(0.05)  # First frame is now in flight
+        await collector.stop()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*waiters, return_exceptions=True), timeout=1
+        )
+        assert started == [1]
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_stop_without_start(self, make_service):
+        """stop() on a collector that never ran is a no-op"""
+        await BatchCollector(make_service()).stop()
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    """Short MJPG clip whose frames are numbered by their pixel value"""
+    path = tmp_path / "clip.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30, (320, 240))
+    if not writer.isOpened():
+        pytest.skip("no MJPG encoder available")
+    for i in range(40):
+        writer.write(np.full((240, 320, 3), i * 5, dtype=np.uint8))
+    writer.release()
+    return str(path)
+
+
+class TestVideoStreamPipeline:
+    """Test process_video_stream shutdown paths"""
+
+    @pytest.mark.asyncio
+    async def test_clean_end_delivers_every_frame(self, make_service, video_file):
+        """At end of file, results still queued reach the callback in order"""
+        service = make_service()
+        delivered = []
+
+        async def slow_callback(frame, detections, frame_count, node_id):
+            await asyncio.sleep(0.01)  # Lets the prefetch queues fill up
+            delivered.append(frame_count)
+
+        await asyncio.wait_for(
+            service.process_video_stream(video_file, slow_callback, target_fps=30, prefetch=4),
+            timeout=10
+        )
+
+        assert delivered == list(range(1, 41))
+
+    @pytest.mark.asyncio
+    async def test_callback_failure_stops_delivery(self, make_service, video_file):
+        """After a callback error nothing else is delivered and the call returns"""
+        service = make_service()
+        delivered = []
+
+        async def failing_callback(frame, detections, frame_count, node_id):
+            delivered.append(frame_count)
+            if frame_count == 5:
+                raise RuntimeError("sink unavailable")
+
+        await asyncio.wait_for(
+            service.process_video_stream(video_file, failing_callback, target_fps=30, prefetch=4),
+            timeout=10
+        )
+
+        assert delivered == [1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_frame_skip(self, make_service, video_file):
+        """Only every Nth frame is processed for a lower target FPS"""
+        service = make_service()
+        delivered = []
+
+        async def callback(frame, detections, frame_count, node_id):
+            delivered.append(frame_count)
+
+        await service.process_video_stream(video_file, callback, target_fps=10)
+
+        assert delivered == list(range(3, 41, 3))
+
+    @pytest.mark.asyncio
+    async def test_unopenable_source_returns(self, make_service, tmp_path):
+        """A source that can't be opened ends the call without callbacks"""
+        service = make_service()
+        delivered = []
+
+        async def callback(*args):
+            delivered.append(args)
+
+        await asyncio.wait_for(
+            service.process_video_stream(str(tmp_path / "missing.avi"), callback),
+            timeout=10
+        )
+
+        assert delivered == []
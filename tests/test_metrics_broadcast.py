@@ -0,0 +1,125 @@
+"""
+Test suite for the backend system_metrics delta broadcast
+
+Covers _metrics_delta (only changed sections are sent) and the emit worker
+recording sections as sent only once their emit has gone out.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("socketio")
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "src" / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+import server
+
+
+@pytest.fixture(autouse=True)
+def clean_sections():
+    server._last_metric_sections.clear()
+    yield
+    server._last_metric_sections.clear()
+
+
+def _metrics(cpu=10.0, memory=50.0, timestamp="t0"):
+    return {
+        'cpu': {'usage_percent': cpu},
+        'memory': {'percent': memory},
+        'timestamp': timestamp,
+        'uptime_seconds': 1
+    }
+
+
+def _commit(encoded_sections):
+    """What emit_worker does after a successful emit"""
+    server._last_metric_sections.update(encoded_sections)
+
+
+class TestMetricsDelta:
+    """Test section-level change detection"""
+
+    def test_first_snapshot_is_complete(self):
+        """With nothing sent yet every section is in the delta"""
+        delta, encoded = server._metrics_delta(_metrics())
+
+        assert delta == _metrics()
+        assert set(encoded) == {'cpu', 'memory'}
+
+    def test_delta_does_not_record_sections(self):
+        """Computing a delta leaves the sent-state to the emit worker"""
+        server._metrics_delta(_metrics())
+
+        assert server._last_metric_sections == {}
+
+    def test_unchanged_metrics_give_empty_delta(self):
+        """Volatile keys alone never trigger a broadcast"""
+        _, encoded = server._metrics_delta(_metrics(timestamp="t0"))
+        _commit(encoded)
+
+        delta, encoded = server._metrics_delta(_metrics(timestamp="t1"))
+
+        assert delta == {}
+        assert encoded == {}
+
+    def test_only_changed_sections_sent(self):
+        """A changed section is sent with the volatile keys, others are not"""
+        _, encoded = server._metrics_delta(_metrics())
+        _commit(encoded)
+
+        delta, encoded = server._metrics_delta(_metrics(cpu=75.5, timestamp="t1"))
+
+        assert delta == {'cpu': {'usage_percent': 75.5}, 'timestamp': "t1", 'uptime_seconds': 1}
+        assert set(encoded) == {'cpu'}
+
+    def test_uncommitted_delta_is_resent(self):
+        """A delta that never went out is computed again on the next tick"""
+        server._metrics_delta(_metrics(cpu=20.0))
+
+        delta, _ = server._metrics_delta(_metrics(cpu=20.0, timestamp="t1"))
+
+        assert delta['cpu'] == {'usage_percent': 20.0}
+
+
+class TestEmitWorkerCommit:
+    """Test that sections are recorded only after a successful emit"""
+
+    async def _run(self, monkeypatch, emit):
+        monkeypatch.setattr(server.sio, "emit", emit)
+        monkeypatch.setattr(server, "connected_clients", 1)
+        monkeypatch.setattr(server, "emit_queue", asyncio.Queue(maxsize=8))
+        worker = asyncio.create_task(server.emit_worker())
+        delta, encoded = server._metrics_delta(_metrics())
+        server.post_event('system_metrics', delta, encoded)
+        await asyncio.sleep(server.EMIT_BATCH_WINDOW + 0.1)
+        worker.cancel()
+
+    @pytest.mark.asyncio
+    async def test_successful_emit_records_sections(self, monkeypatch):
+        """Sections carried by an emitted delta count as sent"""
+        sent = []
+
+        async def emit(event, data=None, **kwargs):
+            sent.append((event, data))
+
+        await self._run(monkeypatch, emit)
+
+        assert [event for event, _ in sent] == ['system_metrics']
+        assert set(server._last_metric_sections) == {'cpu', 'memory'}
+
+    @pytest.mark.asyncio
+    async def test_failed_emit_records_nothing(self, monkeypatch):
+        """A failed emit leaves its sections to be sent again"""
+        async def emit(event, data=None, **kwargs):
+            raise ConnectionError("transport closed")
+
+        await self._run(monkeypatch, emit)
+
+        assert server._last_metric_sections == {}
+        delta, _ = server._metrics_delta(_metrics(timestamp="t1"))
+        assert set(delta) >= {'cpu', 'memory'}
@@ -0,0 +1,135 @@
+"""
+Test suite for the backend mock detection store
+
+Covers the packed uint64 bbox column (pack/unpack round trip, range
+checks) and the vectorized ROI filter, directly and through the
+/api/detections endpoint.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("pydantic_settings")
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "src" / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.routers import mock_routers
+from src.routers.mock_routers import _bbox_field, _pack_bbox, _roi_mask
+
+
+def _unpack(packed):
+    return np.column_stack([_bbox_field(packed, f) for f in range(4)])
+
+
+@pytest.fixture(scope="module")
+def client():
+    app = FastAPI()
+    app.include_router(mock_routers.detection_router, prefix="/api/detections")
+    return TestClient(app)
+
+
+class TestBboxPacking:
+    """Test the 16-bit-per-field bbox packing"""
+
+    def test_round_trip(self):
+        """Packing then unpacking returns the original fields"""
+        rng = np.random.default_rng(3)
+        boxes = rng.integers(0, 0x10000, (200, 4))
+
+        assert np.array_equal(_unpack(_pack_bbox(boxes)), boxes)
+
+    def test_field_extremes_round_trip(self):
+        """0 and 65535 in any field survive without touching the neighbours"""
+        boxes = np.array([
+            [0, 0, 0, 0],
+            [0xFFFF, 0xFFFF, 0xFFFF, 0xFFFF],
+            [0xFFFF, 0, 0xFFFF, 0],
+            [0, 0xFFFF, 0, 0xFFFF],
+        ])
+
+        assert np.array_equal(_unpack(_pack_bbox(boxes)), boxes)
+
+    def test_layout(self):
+        """x is the low 16 bits and height the high 16 bits"""
+        packed = _pack_bbox(np.array([[1, 2, 3, 4]]))
+
+        assert int(packed[0]) == 1 | 2 << 16 | 3 << 32 | 4 << 48
+        assert packed.dtype == np.uint64
+
+    @pytest.mark.parametrize("box", [[-1, 0, 10, 10], [0, 0, 0x10000, 10]])
+    def test_out_of_range_rejected(self, box):
+        """Values that don't fit in 16 bits raise instead of being truncated"""
+        with pytest.raises(ValueError):
+            _pack_bbox(np.array([box]))
+
+    def test_store_matches_served_rows(self):
+        """The packed column unpacks to the bboxes the API serves"""
+        served = [[d['bbox'][k] for k in ('x', 'y', 'width', 'height')]
+                  for d in mock_routers.MOCK_DETECTIONS]
+
+        assert np.array_equal(_unpack(mock_routers._DET_BBOX), served)
+
+
+class TestRoiMask:
+    """Test the vectorized region-of-interest filter"""
+
+    BOXES = _pack_bbox(np.array([
+        [10, 10, 20, 20],    # inside (0, 0)-(100, 100)
+        [0, 0, 100, 100],    # exactly the ROI: edges are inclusive
+        [90, 90, 20, 20],    # sticks out of the ROI bottom-right
+        [200, 200, 5, 5],    # entirely outside
+    ]))
+
+    def test_containment(self):
+        assert _roi_mask(self.BOXES, 0, 0, 100, 100).tolist() == [True, True, False, False]
+
+    def test_partial_overlap_excluded(self):
+        """Boxes only partly inside the ROI don't match"""
+        assert not _roi_mask(self.BOXES, 95, 95, 300, 300)[2]
+
+    def test_inverted_roi_matches_nothing(self):
+        assert not _roi_mask(self.BOXES, 100, 100, 0, 0).any()
+
+    def test_roi_beyond_field_range(self):
+        """ROI corners outside 0..65535 compare without overflow"""
+        assert _roi_mask(self.BOXES, -10, -10, 70000, 70000).all()
+        assert not _roi_mask(self.BOXES, 70000, 70000, 80000, 80000).any()
+
+    def test_empty_roi(self):
+        """A zero-area ROI only matches zero-area boxes at that point"""
+        assert not _roi_mask(self.BOXES, 10, 10, 10, 10).any()
+
+
+class TestDetectionsRoiEndpoint:
+    """Test the roi query parameter on the detections list"""
+
+    def test_roi_filter(self, client):
+        everything = client.get("/api/detections/").json()
+        inside = client.get("/api/detections/", params={"roi": "0,0,600,600"}).json()
+
+        expected = [
+            d['id'] for d in everything
+            if d['bbox']['x'] + d['bbox']['width'] <= 600
+            and d['bbox']['y'] + d['bbox']['height'] <= 600
+        ]
+        assert [d['id'] for d in inside] == expected
+
+    def test_roi_covering_frame_returns_all(self, client):
+        response = client.get("/api/detections/", params={"roi": "0,0,2000,2000"})
+
+        assert len(response.json()) == len(mock_routers.MOCK_DETECTIONS)
+
+    @pytest.mark.parametrize("roi", ["1,2,3", "a,b,c,d", "0,0,10,10,20"])
+    def test_malformed_roi(self, client, roi):
+        assert client.get("/api/detections/", params={"roi": roi}).status_code == 400
+
+    def test_inverted_roi(self, client):
+        assert client.get("/api/detections/", params={"roi": "600,600,0,0"}).status_code == 400